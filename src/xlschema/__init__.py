@@ -1,12 +1,16 @@
 """Provides the main API and entrypoint to use `xlschema` as a library."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import shutil
 
 from . import config
 from . import readers
 from . import writers as _  # noqa DO NOT DELETE import required for writer registration
+from .common.cache import FileCache
+from .common.context_managers import OrderedLogs, Worker
 from .common.dict import easy_options
+from .common.exceptions import AggregateWriterError
 from .uri import URIParser
 
 # ----------------------------------------------------------
@@ -29,6 +33,9 @@ class XLSchema:
     This class is the core application and entrypoint.
     """
 
+    # options which change the schema produced by readers
+    SCHEMA_CACHE_OPTIONS = ('schema_only', 'streaming', 'columnar')
+
     def __init__(self, uri, options=None, **kwds):
         """Main API entrypoint.
 
@@ -51,7 +58,7 @@ class XLSchema:
         # init reader
         self.reader = self.get_reader(self.uri, self.options)
         self.schema = self.reader.schema
-        self._writers = []
+        self._writer_cache = {}
 
     def setup_local_dirs(self):
         """Check for and create local directory for data or output files."""
@@ -64,25 +71,66 @@ class XLSchema:
                 target = local_dir / directory
                 shutil.copytree(str(source), str(target))
 
-    def _dispatch(self, command, writer_types):
+    def _dispatch(self, command, writer_types, **kwds):
         """Internal method to dispatch arbitrary operations to writer(s).
 
+        With the ``jobs`` option > 1 writers run concurrently in a thread
+        pool. Their log records are then emitted in writer order and all
+        failures are raised together as an
+        :py:class:`xlschema.common.exceptions.AggregateWriterError`. Pools
+        the writers would start (e.g. to read database tables) run
+        sequentially instead, see
+        :py:class:`xlschema.common.context_managers.Worker`.
+
         :param writer_types: list of writer ids of the form '<file_suffix>/<method>'
         :type writer_types: tuple[str]
+
+        :param kwds: keyword arguments passed to the command
+        :type kwds: dict
         """
         if not writer_types:
             writer_types = self.writer_types
 
+        tasks = []
         for writer_type in writer_types:
             writer = self.get_writer(writer_type)
             if not writer:
                 continue
             if hasattr(writer, command):
-                getattr(writer, command)()
+                tasks.append((writer_type, getattr(writer, command)))
             else:
                 self.log.error("Writer '%s' does not have method '%s'",
                                writer_type, command)  # pragma: no cover
 
+        jobs = Worker.jobs(self.options)
+        if jobs <= 1 or len(tasks) <= 1:
+            for writer_type, method in tasks:
+                self._execute(writer_type, method, **kwds)
+            return
+
+        errors = {}
+        with OrderedLogs() as logs:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                futures = [
+                    executor.submit(logs.wrap(i, Worker.wrap(self._execute)),
+                                    writer_type, method, **kwds)
+                    for i, (writer_type, method) in enumerate(tasks)]
+                for i, future in enumerate(futures):
+                    exc = future.exception()
+                    logs.flush(i)
+                    if exc is not None:
+                        errors[tasks[i][0]] = exc
+        if errors:
+            raise AggregateWriterError(errors)
+
+    def _execute(self, writer_type, method, **kwds):
+        """Calls a writer method (a failed write on a KeyError is skipped)."""
+        skipped = (KeyError,) if method.__name__ == 'write' else ()
+        try:
+            method(**kwds)
+        except skipped:
+            self.log.warning("skipping: %s", writer_type)
+
     def get_reader(self, uri, options=None, **kwds):
         """Returns a specialized schema reader based parsed uri.
 
@@ -109,10 +157,10 @@ class XLSchema:
         parsed_uri = URIParser(uri)
 
         if parsed_uri.type == 'xlsx':
-            return readers.ExcelToModel(uri, options)
+            return self.get_cached_reader(readers.ExcelToModel, uri, options)
 
         elif parsed_uri.type == 'yaml':
-            return readers.YamlToModel(uri, options)
+            return self.get_cached_reader(readers.YamlToModel, uri, options)
 
         elif parsed_uri.type == 'database':
             if options.sql:
@@ -121,6 +169,46 @@ class XLSchema:
         else:
             raise XLSchemaError("'%s' not a valid resource.", uri)
 
+    def get_cached_reader(self, reader_class, uri, options):
+        """Returns a reader whose schema is loaded from cache if possible.
+
+        Parsed schemas are cached under ``Config.CACHE_DIR/schema`` keyed by
+        the source file's resolved path, a hash of its contents and the
+        options which change the parsed schema (see
+        ``SCHEMA_CACHE_OPTIONS``), so unchanged sources are not parsed
+        again. The path is part of the key because schemas keep it (in
+        their name and in streamed rows). Pass the ``no_cache`` option to
+        bypass the cache.
+
+        :param reader_class: reader to use on a cache miss
+        :type reader_class: type
+
+        :param uri: path to a yaml or xlsx file
+        :type uri: str
+
+        :param options: argparse options
+        :type options: dict-like object
+
+        :rtype: :py:class:`xlschema.readers.abstract.SchemaReader`
+        """
+        if getattr(options, 'no_cache', None):
+            return reader_class(uri, options)
+
+        cache = FileCache('schema')
+        key = cache.make_key(__version__, reader_class.__name__,
+                             str(Path(uri).resolve()),
+                             FileCache.file_digest(uri),
+                             *(bool(getattr(options, name, None))
+                               for name in self.SCHEMA_CACHE_OPTIONS))
+        schema = cache.get(key)
+        if schema is not None:
+            return readers.CacheToModel(uri, options, schema=schema)
+
+        reader = reader_class(uri, options)
+        if reader.cacheable:
+            cache.set(key, reader.schema)
+        return reader
+
     @property
     def writer_types(self):
         """Returns a list of writer types."""
@@ -129,14 +217,26 @@ class XLSchema:
     @property
     def writers(self):
         """Returns a cached list of configured writer instances."""
-        if not self._writers:
-            self._writers = [self.config.WRITERS[wt](self.schema, self.options)
-                             for wt in self.writer_types]
-        return self._writers
+        return [self.get_writer(wt) for wt in self.writer_types]
+
+    def _options_key(self):
+        """Returns a hashable snapshot of the current options."""
+        return tuple(sorted((key, repr(value))
+                            for key, value in self.options.items()))
+
+    def invalidate_writers(self):
+        """Drops cached writers (e.g. after changing the schema in place)."""
+        self._writer_cache.clear()
 
     def get_writer(self, writer_type):
         """Get a special writer based on type.
 
+        Writers (and their specialized schemas) are cached by writer type
+        and options, and rebuilt if ``schema`` is replaced, if its models or
+        enums are added, removed or replaced, or if a model or one of its
+        fields is changed in place (see
+        :py:attr:`xlschema.models.Model.revision`).
+
         :param writer_type: writer format
         :type writer_type: str
 
@@ -145,22 +245,21 @@ class XLSchema:
         if writer_type not in self.config.WRITERS:
             self.log.error("Writer '%s' not found.",
                            writer_type)  # pragma: no cover
-        else:
-            return self.config.WRITERS[writer_type](self.schema, self.options)
+            return None
+        key = (writer_type, self._options_key())
+        schema_key = (id(self.schema),
+                      tuple((id(model), model.revision)
+                            for model in self.schema.models),
+                      tuple(map(id, self.schema.enums.values())))
+        entry = self._writer_cache.get(key)
+        if entry is None or entry[0] != schema_key:
+            writer = self.config.WRITERS[writer_type](self.schema, self.options)
+            entry = self._writer_cache[key] = (schema_key, self.schema, writer)
+        return entry[2]
 
     def write(self, *writer_types, to_path=None):
         """Execute write operation of writer(s)."""
-        if not writer_types:
-            writer_types = self.writer_types
-
-        for writer_type in writer_types:
-            writer = self.get_writer(writer_type)
-            if not writer:
-                continue
-            try:
-                writer.write(to_path=to_path)
-            except KeyError:
-                self.log.warning("skipping: %s", writer_type)
+        self._dispatch('write', writer_types, to_path=to_path)
 
     def run(self, *writer_types):
         """Run all default operations of writer(s)."""
@@ -0,0 +1,107 @@
+"""Persistent on-disk caches.
+
+Caches live in named subdirectories of ``Config.CACHE_DIR`` and store
+pickled python objects by key. ``Config.CACHE_DIR`` is a per-user
+directory, ``$XDG_CACHE_HOME/xlschema`` (``~/.cache/xlschema``) unless
+overridden by ``XLSCHEMA_CACHE``. Loading a pickle can run arbitrary code,
+so entries are trusted: the directory must only be writable by its user::
+
+    FileCache
+"""
+import hashlib
+import logging
+import os
+import pickle
+from pathlib import Path
+
+from ..config import Config
+
+
+class FileCache:
+    """A pickle-backed key/value store in a directory on disk."""
+
+    SUFFIX = '.pickle'
+
+    def __init__(self, name, root=None):
+        """Class constructor.
+
+        :param name: name of the cache (and of its subdirectory)
+        :type name: str
+
+        :param root: optional root directory (defaults to ``Config.CACHE_DIR``)
+        :type root: str or :py:class:`pathlib.Path`
+        """
+        self.name = name
+        self.path = Path(root if root else Config.CACHE_DIR) / name
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def __repr__(self):
+        return "<{} '{}'>".format(self.__class__.__name__, self.path)
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Returns a hex digest key identifying the given parts.
+
+        >>> FileCache.make_key('a', 1) == FileCache.make_key('a', 1)
+        True
+        """
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(repr(part).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    @staticmethod
+    def file_digest(path) -> str:
+        """Returns a hex digest of the contents of the file at path."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as fopen:
+            for chunk in iter(lambda: fopen.read(1 << 16), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        """Returns the path of the file holding key."""
+        return self.path / (key + self.SUFFIX)
+
+    def get(self, key, default=None):
+        """Returns the cached value of key or default if missing/unreadable."""
+        entry = self._entry(key)
+        try:
+            with open(entry, 'rb') as fopen:
+                value = pickle.load(fopen)
+        except FileNotFoundError:
+            return default
+        except Exception as exc:  # stale or corrupt entries are misses
+            self.log.warning('ignoring unreadable cache entry %s: %s', entry, exc)
+            return default
+        self.log.debug('cache hit: %s', entry)
+        return value
+
+    def set(self, key, value) -> bool:
+        """Stores value under key (atomically replacing any old entry).
+
+        Caching is best-effort: failures (unwritable directory, full disk,
+        unpicklable value) are logged and reported by returning False.
+        """
+        entry = self._entry(key)
+        tmp = entry.with_suffix('.{}.tmp'.format(os.getpid()))
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'wb') as fopen:
+                pickle.dump(value, fopen, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(entry)
+        except Exception as exc:
+            self.log.warning('cannot store cache entry %s: %s', entry, exc)
+            return False
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.log.debug('cache store: %s', entry)
+        return True
+
+    def clear(self):
+        """Removes all entries of the cache."""
+        if self.path.exists():
+            for entry in self.path.glob('*' + self.SUFFIX):
+                entry.unlink()
@@ -1,5 +1,6 @@
 """Commonly useful context managers."""
 import logging
+import threading
 import time
 
 
@@ -28,3 +29,148 @@ class Timer(object):
         self.end = time.process_time()
         msg = self.fmt.format((self.end - self.start))
         self.log.info(msg)
+
+
+class _BufferFilter(logging.Filter):
+    """Handler filter diverting records of capturing threads to a buffer."""
+
+    def __init__(self, handler, local):
+        super().__init__()
+        self.handler = handler
+        self.local = local
+
+    def filter(self, record):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            return True
+        buffer.append((self.handler, record))
+        return False
+
+
+class OrderedLogs(object):
+    """Makes logging of concurrent tasks deterministic as a context manager.
+
+    Records logged by a task wrapped with :py:meth:`wrap` are held back
+    and emitted by :py:meth:`flush` in the order of the task keys, as if
+    the tasks had run one after another.
+
+    A single buffering filter is installed per handler while any instance
+    is active (instances may be nested and used from several threads).
+    Records emitted by a flush in a thread running a wrapped task are
+    buffered again by that task, so nested instances compose.
+    """
+
+    # shared by all instances: the capturing thread's buffer, the
+    # installed filters and the number of active instances
+    _local = threading.local()
+    _filters = {}
+    _active = 0
+    _lock = threading.Lock()
+
+    def __init__(self):
+        """Class constructor."""
+        self.buffers = {}
+
+    @staticmethod
+    def _handlers():
+        """Returns all handlers of the root and of existing loggers."""
+        loggers = [logging.getLogger()] + [
+            logger for logger in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger, logging.Logger)]
+        handlers = []
+        for logger in loggers:
+            for handler in logger.handlers:
+                if handler not in handlers:
+                    handlers.append(handler)
+        return handlers
+
+    def __enter__(self):
+        """Install buffering filters on all handlers (if not yet done)."""
+        cls = self.__class__
+        with cls._lock:
+            for handler in self._handlers():
+                if handler not in cls._filters:
+                    _filter = _BufferFilter(handler, cls._local)
+                    handler.addFilter(_filter)
+                    cls._filters[handler] = _filter
+            cls._active += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Emit any remaining records and remove filters if last."""
+        for key in sorted(self.buffers):
+            self.flush(key)
+        cls = self.__class__
+        with cls._lock:
+            cls._active -= 1
+            if not cls._active:
+                for handler, _filter in cls._filters.items():
+                    handler.removeFilter(_filter)
+                cls._filters.clear()
+
+    def wrap(self, key, func):
+        """Returns func logging into the buffer of key when called."""
+        buffer = self.buffers.setdefault(key, [])
+        local = self._local
+
+        def wrapper(*args, **kwds):
+            previous = getattr(local, 'buffer', None)
+            local.buffer = buffer
+            try:
+                return func(*args, **kwds)
+            finally:
+                local.buffer = previous
+        return wrapper
+
+    def flush(self, key):
+        """Emits and discards the buffered records of key."""
+        for handler, record in self.buffers.pop(key, []):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class Worker(object):
+    """Marks the current thread as a worker of a pool as a context manager.
+
+    The ``jobs`` option sizes every worker pool (xlsx sheet processes,
+    database prefetch threads, writer threads). Pools are only run at
+    the outermost level: in a thread running a task of a pool,
+    :py:meth:`jobs` returns 1 so that pools started from within the task
+    run sequentially instead of multiplying the number of threads.
+    """
+
+    _local = threading.local()
+
+    def __enter__(self):
+        """Marks the current thread as a worker."""
+        self.previous = self.is_active()
+        self._local.active = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Restores the previous mark."""
+        self._local.active = self.previous
+
+    @classmethod
+    def is_active(cls) -> bool:
+        """Returns True if the current thread is running a pool task."""
+        return getattr(cls._local, 'active', False)
+
+    @classmethod
+    def jobs(cls, options) -> int:
+        """Returns the number of workers a pool started here may use.
+
+        :param options: argparse options
+        :type options: dict-like object
+        """
+        if cls.is_active():
+            return 1
+        return getattr(options, 'jobs', None) or 1
+
+    @classmethod
+    def wrap(cls, func):
+        """Returns func running as a worker when called."""
+        def wrapper(*args, **kwds):
+            with cls():
+                return func(*args, **kwds)
+        return wrapper
@@ -30,6 +30,21 @@ class WriterError(XLSchemaError):
     pass
 
 
+class AggregateWriterError(WriterError):
+    """Raised when one or more writers of a parallel execution fail."""
+
+    def __init__(self, errors: dict):
+        """Initialize with the failures of each writer.
+
+        :param errors: exceptions keyed by writer type (in execution order)
+        """
+        self.errors = errors
+        lines = ['{}: {}: {}'.format(writer_type, type(exc).__name__, exc)
+                 for writer_type, exc in errors.items()]
+        super().__init__('{} writer(s) failed:\n  {}'.format(
+            len(errors), '\n  '.join(lines)))
+
+
 class TemplateError(XLSchemaError):
     """Raised when template rendering fails."""
     pass
@@ -11,12 +11,19 @@ class List:
 
         >>> List.unique([1, 1, 2, 3, 3, 4])
         [1, 2, 3, 4]
+
+        >>> List.unique([[1], [1], [2]])
+        [[1], [2]]
         """
-        _list = []
-        for item in iterable:
-            if item not in _list:
-                _list.append(item)
-        return _list
+        items = list(iterable)
+        try:
+            return list(dict.fromkeys(items))
+        except TypeError:  # unhashable items
+            _list = []
+            for item in items:
+                if item not in _list:
+                    _list.append(item)
+            return _list
 
     @staticmethod
     def iterate(iterable):
@@ -74,3 +74,16 @@ class CommandMixin:
             else:
                 self.log.error(error_msg)
                 raise ValueError(error_msg)
+
+
+class OptionsMixin:
+    """Mixin class for tolerant access to optional options."""
+
+    def option(self, name, default=None):
+        """Returns the value of option `name` or `default` if unset.
+
+        :param name: name of the option
+        :param default: value returned if option is missing or None
+        """
+        value = getattr(self.options, name, None)
+        return default if value is None else value
@@ -1,13 +1,76 @@
-"""Common templating operations."""
+"""Common templating operations.
+
+Templates are looked up through process-wide :py:class:`TemplateLookup`
+instances (see :py:func:`get_lookup`) which keep compiled template modules
+in a per-user cache directory, ``Config.CACHE_DIR/templates`` by default.
+"""
 import hashlib
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import Any
 
 from mako.lookup import TemplateLookup
 from mako.template import Template
 
+_lookups = {}
+_lookups_lock = threading.Lock()
+
+
+def get_lookup(templates, cache_dir=None) -> TemplateLookup:
+    """Returns the shared template lookup of a templates directory.
+
+    Compiled modules are kept in a subdirectory of cache_dir named after
+    the templates directory, and mako recompiles a template whenever its
+    source is newer than its module.
+
+    :param templates: templates directory
+    :type templates: str or :py:class:`pathlib.Path`
+
+    :param cache_dir: compiled modules directory (default: ``Config.TEMPLATE_CACHE_DIR``)
+    :type cache_dir: str or :py:class:`pathlib.Path`
+    """
+    if cache_dir is None:
+        from ..config import Config
+        cache_dir = Config.TEMPLATE_CACHE_DIR
+    root = str(Path(templates).absolute())
+    key = (root, str(cache_dir))
+    with _lookups_lock:
+        if key not in _lookups:
+            digest = hashlib.md5(root.encode('utf-8')).hexdigest()[:12]
+            _lookups[key] = TemplateLookup(
+                directories=[root],
+                module_directory=str(Path(cache_dir) / digest))
+        return _lookups[key]
+
+
+def compile_templates(templates, cache_dir=None):
+    """Compiles all templates of a directory into the template cache.
+
+    Returns the list of compiled template uris. Files which are not valid
+    templates are logged and skipped.
+
+    :param templates: templates directory
+    :type templates: str or :py:class:`pathlib.Path`
+    """
+    log = logging.getLogger('compile_templates')
+    lookup = get_lookup(templates, cache_dir)
+    root = Path(templates)
+    compiled = []
+    for path in sorted(root.rglob('*')):
+        if not path.is_file() or '__pycache__' in path.parts:
+            continue
+        uri = path.relative_to(root).as_posix()
+        try:
+            lookup.get_template(uri)
+        except Exception as exc:  # pylint: disable=broad-except
+            log.warning('skipping %s: %s', uri, exc)
+            continue
+        log.debug('compiled: %s', uri)
+        compiled.append(uri)
+    return compiled
+
 
 class TemplateEntry:
     """Represents an item (file or folder) to be processed."""
@@ -91,8 +154,7 @@ class TemplateEngine:
         """Initialize class."""
         self.templates = Path(templates)
         self.output = Path(output)
-        self.env = TemplateLookup(
-            directories=[templates], module_directory='/tmp/mako_modules')
+        self.env = get_lookup(templates)
         self.log = logging.getLogger(self.__class__.__name__)
 
     def render(self, entry: str, **kwds: Any) -> None:
@@ -163,9 +225,8 @@ class TemplateEngine:
 
     def _render_from_file(self, src: Path, dst: Path = None, **kwds: Any) -> None:
         """Render from source to destination path."""
-        src_path = self.templates / src
-        template = src_path.read_text()
-        rendered = self.render_template_from_string(template, **kwds)
+        template = self.env.get_template(Path(src).as_posix())
+        rendered = template.render(**kwds)
         if not dst:
             dst = self.output / src
         else:
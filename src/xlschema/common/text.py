@@ -1,11 +1,112 @@
-"""General Text class."""
+"""General Text class.
+
+Case and pluralization transforms are memoized per string in bounded
+LRU caches since templates apply them to the same names many times.
+"""
 import os
 import re
 import string
 import time
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
+TRANSFORM_CACHE_SIZE = 4096
+
+ABERRANT_PLURALS = {
+    'knife': 'knives',
+    'self': 'selves',
+    'elf': 'elves',
+    'life': 'lives',
+    'hoof': 'hooves',
+    'leaf': 'leaves',
+    'echo': 'echoes',
+    'embargo': 'embargoes',
+    'hero': 'heroes',
+    'potato': 'potatoes',
+    'tomato': 'tomatoes',
+    'torpedo': 'torpedoes',
+    'veto': 'vetoes',
+    'child': 'children',
+    'woman': 'women',
+    'man': 'men',
+    'person': 'people',
+    'goose': 'geese',
+    'mouse': 'mice',
+    'barracks': 'barracks',
+    'deer': 'deer',
+    'nucleus': 'nuclei',
+    'syllabus': 'syllabi',
+    'focus': 'foci',
+    'fungus': 'fungi',
+    'cactus': 'cacti',
+    'phenomenon': 'phenomena',
+    'index': 'indices',
+    'appendix': 'appendices',
+    'criterion': 'criteria',
+}
+
+_MIXED_TO_UNDER_RE = re.compile(r'[A-Z]+')
+_UNDER_TO_MIXED_RE = re.compile('_.')
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _plural(text: str) -> str:
+    """Returns the plural of text (see :py:meth:`Text.plural`)."""
+    if text in ABERRANT_PLURALS:
+        return ABERRANT_PLURALS[text]
+    postfix = 's'
+    if len(text) > 2:
+        vowels = 'aeiou'
+        if text[-2:] in ('ch', 'sh'):
+            postfix = 'es'
+        elif text[-1:] == 'y':
+            if (text[-2:-1] in vowels) or (text[0] in Text.UPPERCASE):
+                postfix = 's'
+            else:
+                postfix = 'ies'
+                text = text[:-1]
+        elif text[-2:] == 'is':
+            postfix = 'es'
+            text = text[:-2]
+        elif text[-1:] in ('s', 'z', 'x'):
+            postfix = 'es'
+    return text + postfix
+
+
+def _mixed_to_under_sub(match):
+    """Utility function."""
+    txt = match.group(0).lower()
+    if len(txt) > 1:
+        return '_%s_%s' % (txt[:-1], txt[-1])
+    return '_%s' % txt
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _mixed_to_under(text: str) -> str:
+    """Returns text in underscore form (see :py:meth:`Text.mixed_to_under`)."""
+    if text.endswith('ID'):
+        return _mixed_to_under(text[:-2] + '_id')
+    trans = _MIXED_TO_UNDER_RE.sub(_mixed_to_under_sub, text)
+    if trans.startswith('_'):
+        trans = trans[1:]
+    return trans
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _under_to_mixed(text: str) -> str:
+    """Returns text in camelcase (see :py:meth:`Text.under_to_mixed`)."""
+    if text.endswith('_id'):
+        return _under_to_mixed(text[:-3] + 'ID')
+    return _UNDER_TO_MIXED_RE.sub(lambda m: m.group(0)[1].upper(), text)
+
+
+@lru_cache(maxsize=TRANSFORM_CACHE_SIZE)
+def _classname(text: str) -> str:
+    """Returns text in class form (see :py:attr:`Text.classname`)."""
+    mixed = _under_to_mixed(text)
+    return mixed[0].upper() + mixed[1:]
+
 
 class Text(str):
     """String subclass with color and code manipulation functionality."""
@@ -18,8 +119,8 @@ class Text(str):
     RESET = '\033[0m'
     TIMESTAMP_FMT = '%Y%m%d%H%M%S'
     # TIMESTAMP_FMT = '%Y-%m-%d %H:%M:%S'
-    _mixed_to_under_re = re.compile(r'[A-Z]+')
-    _under_to_mixed_re = re.compile('_.')
+    _mixed_to_under_re = _MIXED_TO_UNDER_RE
+    _under_to_mixed_re = _UNDER_TO_MIXED_RE
 
     @classmethod
     def wrap(cls, value: str = None) -> 'Text':
@@ -110,61 +211,7 @@ class Text(str):
         >>> Text('crisis').plural()
         'crises'
         """
-        aberrant = {
-            'knife': 'knives',
-            'self': 'selves',
-            'elf': 'elves',
-            'life': 'lives',
-            'hoof': 'hooves',
-            'leaf': 'leaves',
-            'echo': 'echoes',
-            'embargo': 'embargoes',
-            'hero': 'heroes',
-            'potato': 'potatoes',
-            'tomato': 'tomatoes',
-            'torpedo': 'torpedoes',
-            'veto': 'vetoes',
-            'child': 'children',
-            'woman': 'women',
-            'man': 'men',
-            'person': 'people',
-            'goose': 'geese',
-            'mouse': 'mice',
-            'barracks': 'barracks',
-            'deer': 'deer',
-            'nucleus': 'nuclei',
-            'syllabus': 'syllabi',
-            'focus': 'foci',
-            'fungus': 'fungi',
-            'cactus': 'cacti',
-            'phenomenon': 'phenomena',
-            'index': 'indices',
-            'appendix': 'appendices',
-            'criterion': 'criteria',
-        }
-        text = str(self)
-        if text in aberrant:
-            result = '%s' % aberrant[text]
-        else:
-            postfix = 's'
-            if len(text) > 2:
-                vowels = 'aeiou'
-                if text[-2:] in ('ch', 'sh'):
-                    postfix = 'es'
-                elif text[-1:] == 'y':
-                    if (text[-2:-1] in vowels) or (text[0] in self.UPPERCASE):
-                        postfix = 's'
-                    else:
-                        postfix = 'ies'
-                        text = text[:-1]
-                elif text[-2:] == 'is':
-                    postfix = 'es'
-                    text = text[:-2]
-                elif text[-1:] in ('s', 'z', 'x'):
-                    postfix = 'es'
-
-            result = '%s%s' % (text, postfix)
-        return Text(result)
+        return Text(_plural(str(self)))
 
     def fullstrip(self) -> 'Text':
         """Strips both ends of text.
@@ -196,19 +243,7 @@ class Text(str):
             >>> Text("FooBarID").mixed_to_under()
             'foo_bar_id'
         """
-        if self.endswith('ID'):
-            return Text(self[:-2] + "_id").mixed_to_under()
-
-        def _mixed_to_under_sub(match):
-            """Utility function."""
-            txt = match.group(0).lower()
-            if len(txt) > 1:
-                return '_%s_%s' % (txt[:-1], txt[-1])
-            return '_%s' % txt
-        trans = self._mixed_to_under_re.sub(_mixed_to_under_sub, self)
-        if trans.startswith('_'):
-            trans = trans[1:]
-        return Text(trans)
+        return Text(_mixed_to_under(str(self)))
 
     def under_to_mixed(self) -> 'Text':
         """Converts text from underscore form to camelcase.
@@ -219,10 +254,7 @@ class Text(str):
         >>> Text('exception_for_id').under_to_mixed()
         'exceptionForID'
         """
-        if self.endswith('_id'):
-            return Text(self[:-3] + "ID").under_to_mixed()
-        return Text(self._under_to_mixed_re.sub(
-            lambda m: m.group(0)[1].upper(), self))
+        return Text(_under_to_mixed(str(self)))
 
     @property
     def camelcase(self) -> 'Text':
@@ -272,7 +304,7 @@ class Text(str):
         >>> Text('foo_bar_baz').classname
         'FooBarBaz'
         """
-        return self.under_to_mixed().capword()
+        return Text(_classname(str(self)))
 
     def under_to_all_caps(self) -> 'Text':
         """Converts text to capitalized form without underscores.
@@ -0,0 +1,98 @@
+"""YAML backend.
+
+Uses the libyaml based ``CSafeLoader`` and ``CSafeDumper`` when pyyaml
+was built with libyaml and falls back to the pure python ``SafeLoader``
+and ``SafeDumper`` otherwise::
+
+    load
+    dump
+    iter_items
+    load_config
+
+Usage::
+
+    >>> load(dump({'a': [1, 2]}))
+    {'a': [1, 2]}
+"""
+import copy
+import os
+import threading
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    from yaml import CDumper as Dumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader, SafeDumper, Dumper
+
+YAMLError = yaml.YAMLError
+
+_config_cache = {}
+_config_lock = threading.Lock()
+
+
+def load(stream):
+    """Parses the first yaml document in stream (a str or file object)."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump(data, stream=None, safe=True, **kwds):
+    """Serializes data as yaml to stream (or returns a str if None).
+
+    Pass ``safe=False`` to also represent arbitrary python objects.
+    """
+    kwds.setdefault('default_flow_style', False)
+    dumper = SafeDumper if safe else Dumper
+    return yaml.dump(data, stream=stream, Dumper=dumper, **kwds)
+
+
+def iter_items(stream):
+    """Yields the items of the top-level sequence of each document in stream.
+
+    Items are composed and constructed one at a time, so memory use is
+    bounded by the size of the largest item rather than of the document.
+    This uses the python ``SafeLoader`` since the libyaml loader does not
+    expose node-level composition.
+
+    >>> list(iter_items('- [1, a]\\n- [2, b]\\n---\\n- [3, c]\\n'))
+    [[1, 'a'], [2, 'b'], [3, 'c']]
+    """
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()  # stream start
+        while not loader.check_event(yaml.StreamEndEvent):
+            loader.get_event()  # document start
+            if loader.check_event(yaml.SequenceStartEvent):
+                loader.get_event()
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    node = loader.compose_node(None, None)
+                    yield loader.construct_document(node)
+                loader.get_event()
+            else:
+                node = loader.compose_node(None, None)
+                if loader.construct_document(node) is not None:
+                    raise YAMLError('expected a sequence of items')
+            loader.get_event()  # document end
+            loader.anchors = {}
+    finally:
+        loader.dispose()
+
+
+def load_config(path):
+    """Returns a parsed yaml config file, cached until the file changes.
+
+    Each call returns a deep copy so callers may modify the result
+    without affecting the cache.
+
+    :param path: path to the yaml file
+    :type path: str or :py:class:`pathlib.Path`
+    """
+    path = os.fspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _config_lock:
+        if key not in _config_cache:
+            with open(path) as fopen:
+                _config_cache[key] = load(fopen)
+        return copy.deepcopy(_config_cache[key])
@@ -6,9 +6,10 @@ from pathlib import Path
 
 # from .writers.abstract import SchemaWriter
 
-from mako.lookup import TemplateLookup
 from sqlalchemy.engine.url import make_url
 
+from .common.templating import get_lookup
+
 # ----------------------------------------------------------
 # CONFIGURATION
 # ----------------------------------------------------------
@@ -31,14 +32,18 @@ class Config:
     LOCAL_OUTPUT = LOCAL_DIR / 'data' / 'output'
     LOCAL_OUTPUT.mkdir(parents=True, exist_ok=True)
     LOCAL_OUTPUT = str(LOCAL_OUTPUT)
+    # cached pickles and compiled templates are loaded as trusted code, so
+    # they are kept per user rather than in a (possibly shared) project
+    CACHE_DIR = Path(os.getenv('XLSCHEMA_CACHE') or Path(
+        os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'xlschema')
+    TEMPLATE_CACHE_DIR = Path(os.getenv('XLSCHEMA_TEMPLATE_CACHE',
+                                        str(CACHE_DIR / 'templates')))
 
     DB_URI = os.getenv('DB_URI', 'sqlite:///tests/data/db/test.sqlite')
     db_uri = make_url(DB_URI)
 
     TEMPLATE_COMMENT_OFFSET = 55
-    TEMPLATE_ENV = TemplateLookup(
-        directories=[str(TEMPLATES)],
-        module_directory='/tmp/mako_modules')
+    TEMPLATE_ENV = get_lookup(TEMPLATES, TEMPLATE_CACHE_DIR)
 
     ENUMS_SHEET = 'ENUMs'
     ACTIONS = ['noprefix']  # acceptable actions
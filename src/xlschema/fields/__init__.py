@@ -17,7 +17,7 @@ specific syntactical and semantic support for translation::
             ScalaField
         FactoryBoyField
 """
-from .abstract import Field, FieldError
+from .abstract import Field, FieldCore, FieldError
 from .sql import PostgresField, PgEnumField, SqliteField
 from .sap import AbapField
 from .haskell import HaskellField
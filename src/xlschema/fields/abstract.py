@@ -3,10 +3,13 @@
 All concrete Field classes must inherit from the abstract `Field` class
 in this module::
 
+    FieldCore
     Field
     FieldError(Exception)
 
 """
+from collections import namedtuple
+from operator import attrgetter
 
 from ..common.text import Text
 from ..common.utils import is_number
@@ -22,10 +25,49 @@ class FieldError(Exception):
 # ----------------------------------------------------------
 # FIELD TYPES
 # ----------------------------------------------------------
+FieldCore = namedtuple('FieldCore', [
+    'name', 'type', 'length', 'index', 'required',
+    'default', 'constraint', 'category', 'action', 'description',
+])
+FieldCore.__doc__ = """Immutable field metadata shared by specialized fields."""
+
+
+def _core_attribute(name):
+    """Returns a property reading (and copying on write) a core attribute."""
+    def fset(self, value):
+        self._core = self._core._replace(**{name: value})
+        self._specialized_core = None
+        # field queries of the model are indexed
+        if self.model is not None:
+            self.model.reindex()
+    return property(attrgetter('_core.' + name), fset)
 
 
 class Field:
-    """Base abstract class for all field types."""
+    """Base abstract class for all field types.
+
+    Fields are slotted to keep large schemas compact: subclasses must
+    declare ``__slots__`` (usually empty) to stay that way.
+
+    Field metadata is held in an immutable :py:class:`FieldCore`, so
+    specialized fields created by :py:meth:`specialize` for each writer
+    share their core with the source field instead of copying it.
+    Assigning a metadata attribute replaces the core of that field only.
+    """
+
+    __slots__ = ('_core', '_specialized_core', 'options', '_model_name',
+                 'model', 'is_last')
+
+    _name = _core_attribute('name')
+    _type = _core_attribute('type')
+    length = _core_attribute('length')
+    index = _core_attribute('index')
+    _required = _core_attribute('required')
+    _default = _core_attribute('default')
+    constraint = _core_attribute('constraint')
+    category = _core_attribute('category')
+    action = _core_attribute('action')
+    description = _core_attribute('description')
 
     VALID_TYPES = [
         'serial',
@@ -41,22 +83,49 @@ class Field:
     def __init__(self, name, ftype, length, index, required,
                  default, constraint, category, action, description, options=None):
         """Field constructor (order is important)."""
-        self._name = Text(name)
-        self._type = Text(ftype)
-        self.length = int(length) if length else length
-        self.index = index
-        self._required = int(required) if required else required
-        self._default = Text.wrap(default) if not is_number(default) else default
-        self.constraint = Text.wrap(constraint)
-        self.category = Text.wrap(category)
-        self.action = Text.wrap(action)
-        self.description = Text.wrap(description)
+        self._core = FieldCore(
+            name=Text(name),
+            type=Text(ftype),
+            length=int(length) if length else length,
+            index=index,
+            required=int(required) if required else required,
+            default=Text.wrap(default) if not is_number(default) else default,
+            constraint=Text.wrap(constraint),
+            category=Text.wrap(category),
+            action=Text.wrap(action),
+            description=Text.wrap(description),
+        )
+        self._init_state(options)
+
+    def _init_state(self, options):
+        """Initializes the per-instance (non-metadata) state."""
+        self._specialized_core = None
         # to be set by parent
         self.options = options
         self._model_name = None
         self.model = None
         self.is_last = False
 
+    def specialize(self, field_class, options=None):
+        """Returns an instance of field_class sharing this field's metadata.
+
+        Equivalent to ``field_class(*self.values(), options=options)`` but
+        the core is built once per source field and then shared by all
+        specializations.
+
+        :param field_class: the specialized field class
+        :type field_class: subclass of :py:class:`Field`
+
+        :param options: optional argparse options
+        :type options: :py:class:`argparse.Namespace`
+        """
+        if self._specialized_core is None:
+            self._specialized_core = Field(*self.values())._core
+        field = field_class.__new__(field_class)
+        field._core = self._specialized_core
+        field._init_state(options)
+        return field
+
     def __repr__(self):
         return "<{} '{}.{}' ({})>".format(
             self.__class__.__name__, self.model_name, self.name, self.type)
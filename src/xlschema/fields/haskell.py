@@ -13,6 +13,8 @@ from .abstract import Field
 class HaskellField(Field):
     """Field type to be used in haskell code generation."""
 
+    __slots__ = ()
+
     TYPES = {
         'str': 'String',        # specified size text
         'txt': 'String',        # arbitrary size text
@@ -16,6 +16,8 @@ from .abstract import Field
 class JavaField(Field):
     """Java specialized field type."""
 
+    __slots__ = ()
+
     TYPES = utils.dictmerge(
         constants.TYPES_COMMON,
         interval='Duration'
@@ -69,6 +71,8 @@ class JavaField(Field):
 class ScalaField(JavaField):
     """Java specialized field type."""
 
+    __slots__ = ()
+
     @property
     def definition(self):
         """Define java bean columns."""
@@ -17,6 +17,8 @@ from .abstract import Field
 class SqlAlchemyField(Field):
     """Sqlalchemy specialized field type."""
 
+    __slots__ = ()
+
     TYPES = utils.dictmerge(
         constants.TYPES_COMMON,
         interval='Interval'
@@ -81,6 +83,8 @@ class SqlAlchemyField(Field):
 class DjangoField(Field):
     """Django specialized field type."""
 
+    __slots__ = ()
+
     TYPES = {
         'int': 'IntegerField',
         'serial': 'IntegerField',
@@ -153,6 +157,8 @@ class FactoryBoyField(Field):
     See: https://github.com/FactoryBoy/factory_boy
     """
 
+    __slots__ = ()
+
     TYPES = {
         'int': 'pyint',
         'serial': 'pyint',
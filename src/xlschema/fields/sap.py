@@ -12,6 +12,8 @@ from .sql import SqlField
 class AbapField(SqlField):
     """Field type to be used in SAP Abap code generation."""
 
+    __slots__ = ()
+
     TYPES = {
         'str': 'STRING',     # specified size text
         'txt': 'STRING',     # arbitrary size text
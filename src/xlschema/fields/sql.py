@@ -17,6 +17,8 @@ from .abstract import Field
 class SqlField(Field):
     """Field type to be used in sql code generation."""
 
+    __slots__ = ()
+
     TYPES = {
         'str': 'varchar({})',    # specified size text
         'txt': 'text',           # arbitrary size text
@@ -101,10 +103,14 @@ class SqlField(Field):
 class PostgresField(SqlField):
     """Postgres specialized field type."""
 
+    __slots__ = ()
+
 
 class PgEnumField(PostgresField):
     """Postgres specialized field type for pgsql with enums."""
 
+    __slots__ = ()
+
     @property
     def type(self):
         """Field type to handle enum special case."""
@@ -116,3 +122,5 @@ class PgEnumField(PostgresField):
 
 class SqliteField(SqlField):
     """Sqlite specialized field type."""
+
+    __slots__ = ()
@@ -8,17 +8,85 @@ translation from one language or framework to another::
             Model
             Enum
             Namespace
+    FieldList
 """
 import logging
 from collections import OrderedDict
 from pathlib import Path
 
-import yaml
-
-from .common.list import List
+from .common import yaml_io
 from .common.text import Text
 from .common.utils import is_number
 from .config import Config
+from .rows import ColumnStore
+
+
+def _noop(value):
+    return value
+
+
+def _clean_date(value):
+    return str(value).replace(' 00:00:00', '')
+
+
+# ftype -> transformer of values for representation (see Model.row_clean)
+TYPE_TRANSFORMERS = {
+    'str': _noop,
+    'txt': _noop,
+    'date': _clean_date,
+    'time': str,
+    'interval': str,
+    'bool': bool,
+    'int': _noop,
+    'dec': _noop,
+    'float': _noop,
+    'double': _noop,
+    'numeric': _noop,
+    'serial': _noop,
+}
+
+
+class FieldList(list):
+    """The fields of a model, reindexing the model whenever changed.
+
+    Only in-place changes go through this class; assigning a new list to
+    :py:attr:`Model.fields` wraps it (and reindexes) as well.
+    """
+
+    __slots__ = ('model',)
+
+    def __init__(self, fields=(), model=None):
+        super().__init__(fields)
+        self.model = model
+
+    def _changed(self):
+        # unset while being unpickled
+        model = getattr(self, 'model', None)
+        if model is not None:
+            model.reindex()
+
+    def _mutator(method):  # pylint: disable=no-self-argument
+        def mutate(self, *args, **kwds):
+            result = method(self, *args, **kwds)
+            self._changed()
+            return result
+        mutate.__name__ = method.__name__
+        mutate.__doc__ = method.__doc__
+        return mutate
+
+    append = _mutator(list.append)
+    extend = _mutator(list.extend)
+    insert = _mutator(list.insert)
+    remove = _mutator(list.remove)
+    pop = _mutator(list.pop)
+    clear = _mutator(list.clear)
+    sort = _mutator(list.sort)
+    reverse = _mutator(list.reverse)
+    __setitem__ = _mutator(list.__setitem__)
+    __delitem__ = _mutator(list.__delitem__)
+    __iadd__ = _mutator(list.__iadd__)
+    __imul__ = _mutator(list.__imul__)
+    del _mutator
 
 
 # ----------------------------------------------------------
@@ -27,6 +95,8 @@ from .config import Config
 class ObjectMixin:
     """Basic object mixin class."""
 
+    __slots__ = ()
+
     def __repr__(self):
         return "<{} '{}'>".format(self.__class__.__name__, self.name)
 
@@ -88,6 +158,8 @@ class Schema(ObjectMixin):
 class Enum(ObjectMixin):
     """Principal class for enum objects which having 2 fields at most."""
 
+    __slots__ = ('name', 'data', 'log', 'config')
+
     def __init__(self, name, data=None):
         """Class constructor.
 
@@ -119,6 +191,10 @@ class Enum(ObjectMixin):
 class Model(ObjectMixin):
     """Principal class for table model objects having N fields."""
 
+    __slots__ = ('name', '_fields', 'data', 'properties', 'metadata',
+                 'options', 'nspace', 'log', 'config', '_transformers',
+                 '_index', '_revision')
+
     def __init__(self, name, fields=None, data=None, properties=None,
                  metadata=None, options=None, nspace_class=None):
         """Class constructor.
@@ -130,7 +206,7 @@ class Model(ObjectMixin):
         :type data: :py:class:`xlschema.fields.abstract.Field`
 
         :param data: optional rows of data
-        :type data: List[tuple]
+        :type data: List[tuple] or a container from :py:mod:`xlschema.rows`
 
         :param properties: optional user visible model properties
         :type properties: dict
@@ -144,9 +220,13 @@ class Model(ObjectMixin):
         :param nspace_class: optional arbitrary namespace class for customization
         :type nspace_class: python class
         """
+        self._revision = 0
+        self._transformers = None
+        self._index = None
         self.name = Text(name)
         self.fields = fields if fields else []
-        self.data = data if data else []
+        # lazy rows must not be loaded by a truth test
+        self.data = data if data is not None else []
         self.properties = properties if properties else OrderedDict()
         self.metadata = metadata if metadata else dict(is_mtm=False)
         self.options = options
@@ -155,18 +235,76 @@ class Model(ObjectMixin):
         self.config = Config()
         self.setup()  # must be run!
 
+    def __setattr__(self, name, value):
+        if not name.startswith('_'):
+            # unset while being unpickled
+            revision = getattr(self, '_revision', 0)
+            object.__setattr__(self, '_revision', revision + 1)
+        object.__setattr__(self, name, value)
+
+    @property
+    def revision(self) -> int:
+        """Returns a counter of changes to the model and its fields.
+
+        It is increased whenever an attribute of the model is assigned and
+        on :py:meth:`reindex`, so it covers in-place changes of fields too.
+        """
+        return self._revision
+
+    @property
+    def fields(self):
+        """Returns the fields of the model (a :py:class:`FieldList`)."""
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = FieldList(fields, model=self)
+        self.reindex()
+
+    def _field_index(self):
+        """Returns the field index (built once per set of fields).
+
+        The index groups fields by index type, category and other
+        commonly queried attributes. It is invalidated by
+        :py:meth:`reindex`, which is called when fields are added,
+        removed or replaced and when one of their attributes is assigned.
+        """
+        if self._index is None:
+            index = dict(by_index={}, by_category={}, category=[],
+                         noncategory=[], required=[], enum=[],
+                         number=[], has_defaults=False, has_actions=False)
+            for field in self.fields:
+                index['by_index'].setdefault(field.index, []).append(field)
+                if field.category:
+                    index['by_category'].setdefault(
+                        field.category, []).append(field)
+                    index['category'].append(field)
+                else:
+                    index['noncategory'].append(field)
+                if field.required:
+                    index['required'].append(field)
+                if field.is_enum:
+                    index['enum'].append(field)
+                if field.is_number:
+                    index['number'].append(field)
+                index['has_defaults'] |= bool(field.default)
+                index['has_actions'] |= bool(field.action)
+            self._index = index
+        return self._index
+
+    def reindex(self):
+        """Invalidates the field index (e.g. after changing a field)."""
+        self._index = None
+        self._transformers = None
+        self._revision += 1
+
     def _has_field(self, ftype):
         """Check for existance of an index field type."""
-        for field in self.fields:
-            if field.index == ftype:
-                return True
-        return False
+        return ftype in self._field_index()['by_index']
 
     def _fields_of_type(self, ftype):
         """Retrieve all instances of an index field type."""
-        return [
-            f for f in self.fields if f.index == ftype
-        ]
+        return list(self._field_index()['by_index'].get(ftype, []))
 
     @property
     def is_mtm(self) -> bool:
@@ -175,17 +313,17 @@ class Model(ObjectMixin):
 
     def setup(self):
         """Sets last field .is_last property to True."""
-        nfields = len(self.fields)
-        for i, field in enumerate(self.fields):
+        self.reindex()
+        for field in self.fields:
             field.model = self
-            if (i == nfields - 1) and (not self.is_mtm):
-                field.is_last = True
+        if self.fields and not self.is_mtm:
+            self.fields[-1].is_last = True
 
     def clone(self, model_class, nspace_class, field_class, options):
         """Used to specialize model_classes,field classes."""
         _fields = []
         for field in self.fields:
-            _field = field_class(*list(field.values()), options=options)
+            _field = field.specialize(field_class, options)
             _field.model = field.model
             _field.is_last = field.is_last
             _fields.append(_field)
@@ -238,27 +376,48 @@ class Model(ObjectMixin):
                 for key, value in self.row_zip(row, quote)]
         return ', '.join(_row)
 
+    def _compile_transformers(self):
+        """Returns per-field transformers and the (index, func) non-noops.
+
+        The pipeline is compiled once and recompiled only if the fields
+        change (see :py:meth:`_field_index`).
+        """
+        if self._transformers is None:
+            funcs = [TYPE_TRANSFORMERS[f.ftype] for f in self.fields]
+            active = [(i, func) for i, func in enumerate(funcs)
+                      if func is not _noop]
+            self._transformers = (funcs, active)
+        return self._transformers
+
     def row_clean(self, row):
         """Returns a transformed and represented row."""
-        noop = lambda x: x
-
-        type_transformers = {
-            'str': noop,
-            'txt': noop,
-            'date': lambda d: str(d).replace(' 00:00:00', ''),
-            'time': str,
-            'interval': str,
-            'bool': bool,
-            'int': noop,
-            'dec': noop,
-            'float': noop,
-            'double': noop,
-            'numeric': noop,
-            'serial': noop,
-        }
-        funcs = [type_transformers[f.ftype] for f in self.fields]
+        funcs, _ = self._compile_transformers()
         return [f(x) for f, x in zip(funcs, row)]
 
+    def rows_clean(self, rows):
+        """Returns a list of transformed and represented rows.
+
+        Only fields whose transformer is not a no-op are touched. Rows in
+        a :py:class:`xlschema.rows.ColumnStore` are transformed column by
+        column.
+
+        :param rows: a batch of rows
+        :type rows: Iterable[tuple] or :py:class:`xlschema.rows.ColumnStore`
+        """
+        _, active = self._compile_transformers()
+        if isinstance(rows, ColumnStore):
+            columns = [rows.values(i) for i in range(len(rows.columns))]
+            for i, func in active:
+                columns[i] = map(func, columns[i])
+            if not columns:
+                return [[] for _ in rows]
+            return [list(row) for row in zip(*columns)]
+        _rows = [list(row) for row in rows]
+        for i, func in active:
+            for row in _rows:
+                row[i] = func(row[i])
+        return _rows
+
     @property
     def definitions(self):
         """Provides single api to list of all field definitions and extras."""
@@ -284,6 +443,7 @@ class Model(ObjectMixin):
     @property
     def mapped_fields(self):
         """Return all fields except the primary key field."""
+        # not indexed: field.type resolves (and checks) the dialect type
         return [
             f for f in self.fields if f.type and f.index != 'pk'
         ]
@@ -291,16 +451,13 @@ class Model(ObjectMixin):
     @property
     def required_fields(self):
         """Return all required (i.e. not null) fields."""
-        return [
-            f for f in self.fields if f.required
-        ]
+        return list(self._field_index()['required'])
 
     @property
     def pk_field(self):
         """Get primary key field."""
-        for field in self.fields:
-            if field.index == 'pk':
-                return field
+        pk_fields = self._field_index()['by_index'].get('pk')
+        return pk_fields[0] if pk_fields else None
 
     @property
     def pk_fields(self):
@@ -351,9 +508,8 @@ class Model(ObjectMixin):
     @property
     def sk_field(self):
         """Get semantic key field."""
-        for field in self.fields:
-            if field.index == 'sk':
-                return field
+        sk_fields = self._field_index()['by_index'].get('sk')
+        return sk_fields[0] if sk_fields else None
 
     @property
     def sk_fields(self):
@@ -391,7 +547,7 @@ class Model(ObjectMixin):
     @property
     def enum_fields(self):
         """Retrieve fields which are specified as enum (in constraints)."""
-        return [field for field in self.fields if field.is_enum]
+        return list(self._field_index()['enum'])
 
     @property
     def enum_fieldnames(self):
@@ -401,17 +557,17 @@ class Model(ObjectMixin):
     @property
     def category_fields(self):
         """Retrieve field which have category specified."""
-        return [field for field in self.fields if field.category]
+        return list(self._field_index()['category'])
 
     @property
     def number_fields(self):
         """Retrieve all number fields."""
-        return [field for field in self.fields if field.is_number]
+        return list(self._field_index()['number'])
 
     @property
     def noncategory_fields(self):
         """Retrieve field which have don't have a category specified."""
-        return [field for field in self.fields if not field.category]
+        return list(self._field_index()['noncategory'])
 
     @property
     def noncategory_fieldnames(self):
@@ -433,11 +589,11 @@ class Model(ObjectMixin):
     @property
     def categories(self):
         """Retrieve set of categories."""
-        return List.unique([field.category for field in self.category_fields])
+        return list(self._field_index()['by_category'])
 
     def fields_for_category(self, category):
         """Retrieve fields for a given category."""
-        return [field for field in self.fields if field.category == category]
+        return list(self._field_index()['by_category'].get(category, []))
 
     def fieldnames_for_category(self, category):
         """Retrieve fieldnames for a given category."""
@@ -451,18 +607,12 @@ class Model(ObjectMixin):
     @property
     def has_defaults(self) -> bool:
         """Returns True if there are any default fields."""
-        for field in self.fields:
-            if field.default:
-                return True
-        return False
+        return self._field_index()['has_defaults']
 
     @property
     def has_actions(self) -> bool:
         """Returns True if there are any action fields."""
-        for field in self.fields:
-            if field.action:
-                return True
-        return False
+        return self._field_index()['has_actions']
 
     @property
     def is_hierarchical(self) -> bool:
@@ -639,4 +789,4 @@ class Namespace:
     @property
     def to_yaml(self):
         """Return yaml version of .to_dict attributes."""
-        return yaml.dump(self.to_dict, default_flow_style=False)
+        return yaml_io.dump(self.to_dict, safe=False)
@@ -8,6 +8,7 @@ from .echo import EchoPlugin
 from .display import DisplayPlugin
 from .sqlacodegen import SqlaCodegenPlugin
 from .splitter import SplitterPlugin
+from .templates import TemplatesPlugin
 
 
 REGISTRY = [
@@ -18,6 +19,7 @@ REGISTRY = [
     DisplayPlugin,
     SqlaCodegenPlugin,
     SplitterPlugin,
+    TemplatesPlugin,
 ]
 
 
@@ -3,8 +3,7 @@ import abc
 import logging
 # from typing import List
 
-import yaml
-
+from ..common import yaml_io
 from ..common.mixins import CommandMixin
 
 
@@ -31,10 +30,8 @@ class Plugin(abc.ABC, CommandMixin):
     @staticmethod
     def register_plugin_subparser(app, cls):
         """Helper staticmethod to register subparser and return options."""
-        with open(app.config_yml) as cfg:
-            yml = yaml.load(stream=cfg, Loader=yaml.SafeLoader)
-            plugin_options = yml['settings']['plugins'][cls.subcommand]['options']
-            # print(cls.subcommand, 'plugin_options:', plugin_options)
+        yml = yaml_io.load_config(app.config_yml)
+        plugin_options = yml['settings']['plugins'][cls.subcommand]['options']
         parser = app.subparsers.add_parser(
             cls.subcommand,
             nspace=plugin_options,
@@ -5,9 +5,8 @@ import logging.config
 import pathlib
 import sys
 
-import yaml
-
 from . import list_plugins
+from ..common import yaml_io
 from ..common.mixins import CommandMixin
 from ..config import Config
 from ..ext.appsettings import SettingsParser
@@ -40,8 +39,7 @@ class PluginApplication(CommandMixin):
 
     def configure_global_options(self):
         """Loads and returns global options, logging config from .yml file."""
-        with open(self.config_yml) as cfg:
-            yml = yaml.safe_load(stream=cfg)
+        yml = yaml_io.load_config(self.config_yml)
         logging.config.dictConfig(yml['logging'])
         global_options = yml['settings']['global']['options']
         return global_options
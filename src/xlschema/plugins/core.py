@@ -26,7 +26,19 @@ class CorePlugin(Plugin):
         option('--populate', '-p', action='store_true', help='populate database')
         option('--update-only', '-u', action='store_true', help='only gen update code')
         option('--models-only', action='store_true', help='only gen model code')
+        option('--schema-only', action='store_true', help='do not read data rows')
         option('--view', '-v', action='store_true', help='include views')
+        option('--streaming', action='store_true',
+               help='stream rows from source instead of holding them (low memory)')
+        option('--fetch-size', type=int, help='rows per fetch when reading from a database')
+        option('--jobs', '-j', type=int, help='number of parallel workers')
+        option('--columnar', action='store_true',
+               help='store model data in typed columns (low memory)')
+        option('--no-cache', action='store_true', help='do not use on-disk caches')
+        option('--batch-size', type=int,
+               help='rows per insert statement in generated sql (e.g. 500)')
+        option('--deep-validate', action='store_true',
+               help='check every item of template context data')
 
         # sql options
         option('--table', '-t', nargs='*', help="table(s) to dump")
@@ -64,17 +76,17 @@ class CorePlugin(Plugin):
                     for fmt in self.options.format:
                         self.log.info('running to %s using %s method',
                                       self.options.output, fmt)
-                        xlschema.run(fmt)
+                    xlschema.run(*self.options.format)
 
                 else:
                     for fmt in self.options.format:
                         self.log.info('writing to %s using %s method',
                                       self.options.output, fmt)
-                        xlschema.write(fmt)
+                    xlschema.write(*self.options.format)
 
                     if self.options.populate:
                         self.log.warning('populating options triggered')
-                        xlschema.populate(self.options.format)
+                        xlschema.populate(*self.options.format)
 
             elif self.options.run:
                 self.log.info('running all methods to %s', self.options.output)
@@ -0,0 +1,30 @@
+"""A plugin to manage the compiled template cache."""
+from ..common.templating import compile_templates
+from ..config import Config
+from .abstract import Plugin
+
+
+class TemplatesPlugin(Plugin):
+    """Compile templates into the template cache."""
+
+    name = 'templates'
+    subcommand = 'templates'
+    is_active = True
+
+    @classmethod
+    def setup_cmdline(cls, app):
+        """Set up and register cmdline options for templates plugin instance."""
+        opt = cls.register_plugin_subparser(app, cls)
+        opt('action', choices=['compile'], help='templates action')
+        opt('--templates', '-t', type=str, help='templates directory')
+        opt('--cache-dir', type=str, help='compiled templates directory')
+
+    def execute(self, *args, **kwds):
+        """Pre-compile all templates into the template cache."""
+        self.log.debug('options: %s', self.options)
+        templates = self.options.templates or Config.TEMPLATES
+        cache_dir = self.options.cache_dir or Config.TEMPLATE_CACHE_DIR
+        compiled = compile_templates(templates, cache_dir)
+        self.log.info('compiled %s templates from %s into %s',
+                      len(compiled), templates, cache_dir)
+        self.store['success'] = True
@@ -9,8 +9,12 @@ Converters translate from one domain to another::
 
     yaml
         YamlToModel
+
+    cache
+        CacheToModel
 """
 
+from .cache import CacheToModel
 from .db import DBToModel, SqlToModel
 from .yaml import YamlToModel
 from .xlsx import ExcelToModel
@@ -2,15 +2,18 @@
 
 import abc
 import logging
+from functools import partial
 from typing import List
 
+from ..common.mixins import OptionsMixin
 from ..config import Config
 from ..fields import Field
 from ..models import Schema
+from ..rows import ColumnStore, LazyRows
 from ..uri import URIParser
 
 
-class SchemaReader(abc.ABC):
+class SchemaReader(abc.ABC, OptionsMixin):
     """Abstract base class for schema-based readers.
 
     Parses uris (.xlsx, .yaml) into relational models.
@@ -31,8 +34,13 @@ class SchemaReader(abc.ABC):
         - ``.models`` must be populated with :py:class:`xlschema.models.Model` instances
         - ``.enums`` must be populated with :py:class:`xlschema.models.Enum` instances
         - ``.types`` must be populated with a set of types used in the schema
+
+    Readers set ``cacheable`` to False if their schema depends on more
+    than the contents of ``uri`` (and so must not be cached by content hash).
     """
 
+    cacheable = True
+
     def __init__(self, uri: str, options: dict = None) -> None:
         """Init SchemaReader.
 
@@ -71,6 +79,24 @@ class SchemaReader(abc.ABC):
                 model.metadata['is_mtm'] = True
             for field in model.fields:
                 self.schema.types.add(field.type)
+        if self.option('columnar', False):
+            self.to_columnar()
+
+    def to_columnar(self):
+        """Stores model data column by column.
+
+        See :py:class:`xlschema.rows.ColumnStore`. Lazy rows are stored in
+        columns once loaded; streamed rows are left as they are.
+        """
+        for model in self.schema.models:
+            factory = partial(ColumnStore.from_model, model)
+            if isinstance(model.data, LazyRows):
+                if model.data.is_loaded:
+                    model.data = factory(model.data.load())
+                else:
+                    model.data.factory = factory
+            elif isinstance(model.data, list):
+                model.data = factory(model.data)
 
     @staticmethod
     def identify_mtm_tables(model_names: List[str]) -> List[str]:
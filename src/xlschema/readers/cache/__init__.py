@@ -0,0 +1,35 @@
+"""Cached Schema SchemaReader."""
+from .. import abstract
+
+# ----------------------------------------------------------
+# Cache Conversion
+# ----------------------------------------------------------
+
+
+class CacheToModel(abstract.SchemaReader):
+    """Provides a previously parsed schema loaded from the schema cache.
+
+    Used by :py:meth:`xlschema.XLSchema.get_reader` when the content hash
+    of a yaml or xlsx source matches a cached entry, so the source file
+    is not parsed again.
+    """
+
+    def __init__(self, uri: str, options: dict = None, schema=None) -> None:
+        """Init CacheToModel.
+
+        :param uri: the (unchanged) source file
+        :param options: optional dict-like namespace
+        :param schema: the cached schema
+        """
+        self.cached_schema = schema
+        super().__init__(uri, options)
+
+    def preprocess(self):
+        """Runs before main process for conversion."""
+        self.log.debug('using cached schema of %s', self.uri)
+
+    def process(self):
+        """Main process for conversion."""
+        self.schema = self.cached_schema
+        if self.option('columnar', False):
+            self.to_columnar()
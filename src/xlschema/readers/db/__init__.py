@@ -1,10 +1,17 @@
 """DB to Model SchemaReader."""
+import threading
 from datetime import date, datetime
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 from .. import abstract
 from ... import models
+from ...common.cache import FileCache
+from ...common.context_managers import Worker
+from ...rows import LazyRows, StreamingRows
 
+import sqlalchemy
 from sqlalchemy import MetaData, create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -15,16 +22,106 @@ from sqlalchemy.orm import sessionmaker, Session
 
 
 class DBToModel(abstract.SchemaReader):
-    """Parses db tables into relational models."""
+    """Parses db tables into relational models.
+
+    Rows are selected lazily. In streaming mode they are fetched through a
+    server-side cursor in batches of ``fetch_size`` rows every time a
+    writer iterates over them, so tables larger than memory can be dumped.
+    Otherwise, if ``jobs`` is greater than 1, the first time the rows of a
+    table are needed the rows of all other tables are read concurrently by
+    a thread pool sharing the engine's connection pool, unless they are
+    first needed by writers already running concurrently (see
+    :py:class:`xlschema.common.context_managers.Worker`). Runs which never
+    touch model data never select any rows.
+    """
+
+    FETCH_SIZE = 1000
+    CATALOG_QUERIES = {
+        'sqlite': (
+            "select type, name, tbl_name, sql from sqlite_master "
+            "order by type, name"),
+        'postgresql': (
+            "select 'c', c.relname, c.xmin::text "
+            "from pg_class c "
+            "join pg_namespace n on n.oid = c.relnamespace "
+            "where n.nspname = current_schema() "
+            "union all "
+            "select 'a', c.relname, a.xmin::text "
+            "from pg_attribute a "
+            "join pg_class c on c.oid = a.attrelid "
+            "join pg_namespace n on n.oid = c.relnamespace "
+            "where n.nspname = current_schema() and a.attnum > 0 "
+            "union all "
+            "select 'k', c.relname, k.xmin::text "
+            "from pg_constraint k "
+            "join pg_class c on c.oid = k.conrelid "
+            "join pg_namespace n on n.oid = c.relnamespace "
+            "where n.nspname = current_schema() "
+            "order by 1, 2, 3"),
+    }
 
     def preprocess(self):
         """Runs before main process method for conversion.
 
         Place reader specific instance variable here
         """
-        self.engine = create_engine(self.uri)
+        jobs = self.option('jobs', 1)
+        # size the connection pool to serve one connection per worker
+        engine_options = dict(pool_size=jobs) if jobs > 1 else {}
+        self.engine = create_engine(self.uri, **engine_options)
         self.meta = MetaData()
-        self.meta.reflect(bind=self.engine)
+        self.prefetched = []
+        self._prefetch_lock = threading.Lock()
+        self.reflect()
+
+    def catalog_fingerprint(self):
+        """Returns a digest of the database catalog or None if unsupported.
+
+        The digest changes whenever tables, columns or constraints change,
+        so it can be used to validate cached reflection results.
+        """
+        query = self.CATALOG_QUERIES.get(self.engine.dialect.name)
+        if not query:
+            return None
+        with self.engine.connect() as conn:
+            rows = [tuple(row) for row in conn.execute(text(query))]
+        return FileCache.make_key(*rows)
+
+    def reflect(self):
+        """Reflects table metadata, restricted to the ``table`` option if set.
+
+        Restricted reflection only inspects the requested tables (missing
+        names are ignored) and does not follow foreign keys into other
+        tables. Results are cached on disk keyed by uri, requested tables,
+        catalog fingerprint and the xlschema and sqlalchemy versions (the
+        pickled metadata depends on both) unless the ``no_cache`` option is
+        set.
+        """
+        from ... import __version__  # not yet defined on module import
+        tables = self.option('table')
+        fingerprint = None
+        if not self.option('no_cache', False):
+            fingerprint = self.catalog_fingerprint()
+        if fingerprint:
+            cache = FileCache('reflection')
+            key = cache.make_key(__version__, sqlalchemy.__version__,
+                                 self.uri, sorted(tables or []), fingerprint)
+            meta = cache.get(key)
+            if meta is not None:
+                self.log.debug('using cached reflection of %s', self.uri)
+                self.meta = meta
+                return
+
+        if tables:
+            self.log.debug('reflecting tables: %s', tables)
+            self.meta.reflect(bind=self.engine,
+                              only=lambda name, _: name in tables,
+                              resolve_fks=False)
+        else:
+            self.meta.reflect(bind=self.engine)
+
+        if fingerprint:
+            cache.set(key, self.meta)
 
     def process(self):
         """Main process for conversion."""
@@ -38,7 +135,7 @@ class DBToModel(abstract.SchemaReader):
                 if name not in self.options.table:
                     continue
             model_names.append(name)
-            model = models.Model(name)
+            _fields = []
             for col in table.columns:
                 field = dict(name=col.name, type=col.type.python_type.__name__)
                 if col.primary_key:
@@ -49,17 +146,72 @@ class DBToModel(abstract.SchemaReader):
                     field['required'] = True
                 if col.default:
                     field['default'] = col.default  # pragma: no cover
-                model.fields.append(self.field_class.from_dict(field))
+                _fields.append(self.field_class.from_dict(field))
+            model = models.Model(name, _fields)
 
-            with self.engine.connect() as conn:
-                result = conn.execute(table.select())
-                for row in result:
-                    cleaned_row = model.row_clean(row)
-                    model.data.append(cleaned_row)
+            # rows are only selected when a writer asks for model.data
+            if not self.option('schema_only', False):
+                if self.option('streaming', False):
+                    model.data = StreamingRows(
+                        partial(self.read_rows, table, model),
+                        probe=partial(self.has_rows, table))
+                else:
+                    model.data = LazyRows(
+                        partial(self.read_rows_prefetch, table, model))
             self.schema.models.append(model)
 
         self.post_process(model_names)
 
+    def read_rows_prefetch(self, table, model):
+        """Reads the rows of a table, prefetching all other tables once.
+
+        See :py:meth:`prefetch_rows`.
+        """
+        jobs = Worker.jobs(self.options)
+        if jobs > 1:
+            self.prefetch_rows(jobs, exclude=model)
+        return self.read_rows(table, model)
+
+    def prefetch_rows(self, jobs, exclude=None):
+        """Starts reading the rows of all models concurrently (only once).
+
+        Rows are read in the background by up to ``jobs`` threads. The
+        futures are kept in ``prefetched``. A failed read is retried (and
+        its error raised) when its rows are used.
+
+        :param jobs: number of worker threads (and pooled connections)
+        :param exclude: model whose rows are read by the caller
+        """
+        with self._prefetch_lock:
+            if self.prefetched:
+                return
+            lazy_rows = [model.data for model in self.schema.models
+                         if model is not exclude
+                         and isinstance(model.data, LazyRows)
+                         and not model.data.is_loaded]
+            self.log.debug('reading %s tables with %s jobs',
+                           len(lazy_rows), jobs)
+            executor = ThreadPoolExecutor(max_workers=jobs)
+            self.prefetched = [executor.submit(Worker.wrap(rows.load))
+                               for rows in lazy_rows]
+            executor.shutdown(wait=False)
+
+    def has_rows(self, table) -> bool:
+        """Returns True if a table has any rows (selecting at most one)."""
+        with self.engine.connect() as conn:
+            return conn.execute(table.select().limit(1)).first() is not None
+
+    def read_rows(self, table, model):
+        """Yields the cleaned rows of a table batch by batch."""
+        fetch_size = self.option('fetch_size', self.FETCH_SIZE)
+        self.log.debug('selecting rows from %s', table.name)
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(
+                stream_results=True, yield_per=fetch_size)
+            result = conn.execute(table.select())
+            for rows in result.partitions():
+                yield from model.rows_clean(rows)
+
 
 class SqlToModel(abstract.SchemaReader):
     """Sql to abstract models reader."""
@@ -67,9 +219,8 @@ class SqlToModel(abstract.SchemaReader):
     def preprocess(self):
         """Preparations and setup before main process."""
         self.name = 'query'
+        # no reflection: models are derived from query results only
         self.engine = create_engine(self.uri)
-        self.meta = MetaData()
-        self.meta.reflect(bind=self.engine)
         self.session_factory = sessionmaker(self.engine)
 
     def populate(self, counter, sql, rows):
@@ -5,37 +5,104 @@ one another.
 """
 import logging
 from collections import OrderedDict
+from itertools import islice
 # from typing import List
 
+import openpyxl
+
 from ... import fields, models
 from ...common.list import List as ListUtils
+from ...common.mixins import OptionsMixin
 from ...config import Config
+from ...rows import StreamingRows
+
+
+def iter_data_rows(rows):
+    """Yields the data rows (without left header) of sheet rows.
+
+    Rows with an empty first cell are skipped.
+    """
+    for row in ListUtils.iterate(rows):
+        row = row[1:]
+        if not row[0]:  # to skip empty rows
+            continue
+        yield list(row)
+
+
+class SheetRows(StreamingRows):
+    """Data rows of a worksheet, streamed from the workbook file.
+
+    Every iteration opens the workbook read-only and reads the rows
+    following the sheet header, so no rows are held in memory.
+    """
+
+    def __init__(self, uri, name, offset):
+        """Class constructor.
+
+        :param uri: path to the xlsx file
+        :param name: name of the sheet
+        :param offset: number of header rows preceding the data rows
+        """
+        self.uri = uri
+        self.name = name
+        self.offset = offset
+        super(SheetRows, self).__init__(self._iter_rows)
+
+    def __reduce__(self):
+        # rows stay streamed when sent to other processes or cached
+        return (SheetRows, (self.uri, self.name, self.offset))
+
+    def _iter_rows(self):
+        """Yields data rows from a freshly opened read-only workbook."""
+        workbook = openpyxl.load_workbook(
+            self.uri, read_only=True, data_only=True)
+        try:
+            rows = workbook[self.name].iter_rows(
+                min_row=self.offset + 1, values_only=True)
+            yield from iter_data_rows(rows)
+        finally:
+            workbook.close()
 
 # ----------------------------------------------------------------------
 # XL Sheet Types
 # ----------------------------------------------------------------------
 
 
-class XlSheet(object):
+class XlSheet(OptionsMixin):
     """Abstract base excel sheet type."""
 
     FORMAT = ''
 
-    def __init__(self, xlsheet, options=None):
+    def __init__(self, xlsheet, options=None, uri=None):
         """Sheet initializer.
 
         :param xlsheet: parsed sheet of excel workbook
         :param type: :py:class:`openpyxl.worksheet.worksheet.Worksheet`
+
+        :param uri: optional path of the workbook file (used for streaming)
         """
         self.name = xlsheet.title
         self.xlsheet = xlsheet
         self.options = options
+        self.uri = uri
         self.log = logging.getLogger(self.__class__.__name__)
         self.config = Config()
 
     def __repr__(self):
         return "<{} '{}'>".format(self.__class__.__name__, self.name)
 
+    def iter_values(self, min_row=1, max_row=None):
+        """Yields rows of cell values (as tuples) from the sheet.
+
+        Works for both full and read-only (streaming) worksheets since
+        only values, not cell objects, are handed to the caller.
+
+        :param min_row: first row to yield (1-based)
+        :param max_row: optional last row to yield (inclusive)
+        """
+        return self.xlsheet.iter_rows(
+            min_row=min_row, max_row=max_row, values_only=True)
+
     def parse(self):
         """Parse excel sheet data."""
 
@@ -49,24 +116,22 @@ class XlSheet(object):
 class EnumSheet(XlSheet):
     """Enum sheet type."""
 
-    def __init__(self, xlsheet, options=None):
+    def __init__(self, xlsheet, options=None, uri=None):
         """Class constructor.
 
         :param xlsheet: parsed sheet of excel workbook
         :param type: :py:class:`openpyxl.worksheet.worksheet.Worksheet`
         """
-        super(EnumSheet, self).__init__(xlsheet, options)
+        super(EnumSheet, self).__init__(xlsheet, options, uri)
         self.enums = {}
 
     def parse(self):
         """Processes ENUMs sheet in the xlfile."""
         self.log.debug('parsing: %s', self.name)
-        # print('xlsheet.rows:', list(self.xlsheet.rows))
         rows = []
-        for row in self.xlsheet.rows:
+        for row in self.iter_values():
             try:
                 row = row[0], row[1]  # just in case rows are longer than 2
-                row = tuple([i.value for i in row])
                 rows.append(row)
                 self.log.debug('reading enum: %s', row)
             except IndexError:
@@ -89,13 +154,13 @@ class ModelSheet(XlSheet):
     field_class = fields.Field
     model_class = models.Model
 
-    def __init__(self, xlsheet, options=None):
+    def __init__(self, xlsheet, options=None, uri=None):
         """Class constructor.
 
         :param xlsheet: parsed sheet of excel workbook
         :param type: :py:class:`openpyxl.worksheet.worksheet.Worksheet`
         """
-        super(ModelSheet, self).__init__(xlsheet, options)
+        super(ModelSheet, self).__init__(xlsheet, options, uri)
         self.model = None
         self.data = None
 
@@ -115,51 +180,65 @@ class DataSheet(ModelSheet):
 
     FORMAT = 'left-data'
 
+    @property
+    def data_offset(self):
+        """Returns the number of header rows preceding the data rows."""
+        return self.n_metafields
+
+    def _parse_properties(self, rows):
+        """Returns properties at top of sheet (none for plain data sheets)."""
+        return None
+
     def _parse_metadata(self, rows):
         """Returns zip of metadata."""
-        def _parse_row(row):
-            """Returns value of each cell in row (skipping first)."""
-            return [cell.value for cell in row][1:]
-
-        return list(
-            zip(*[_parse_row(rows[i]) for i in range(self.n_metafields)]))
+        return list(zip(*[row[1:] for row in rows]))
 
-    def _parse_metafield_data(self, offset=0):
-        """Returns returns list of metafield data."""
+    def _parse_metafield_data(self, rows):
+        """Returns list of metafield data from the next metafield rows."""
         self.log.debug('\tparsing %s metadata', self.name)
+        metarows = islice(rows, self.n_metafields)
         # field metadata values are in reverse and must be flipped around
         return [
             list(reversed(list(args)))
-            for args in self._parse_metadata(list(self.xlsheet.rows)[offset:])
+            for args in self._parse_metadata(metarows)
         ]
 
-    def _parse_data(self, offset=0):
-        """Returns row by row data."""
+    def _parse_data(self, rows):
+        """Returns row by row data from the remaining rows.
+
+        In streaming mode the rows are not read here but streamed from
+        the workbook file whenever the model data is iterated.
+        """
         self.log.debug('\tparsing %s data', self.name)
-        data = list(self.xlsheet.rows)[self.n_metafields + offset:]
-        row_values = []
-        for row in ListUtils.iterate(data):
-            row = row[1:]
-            if not row[0].value:  # to skip empty rows
-                continue
-            row_values.append([c.value for c in row])
-        return row_values
+        if self.option('streaming', False) and self.uri:
+            return SheetRows(self.uri, self.name, self.data_offset)
+        return list(iter_data_rows(rows))
 
     def parse(self):
-        """Processes an xlsheet with embedded data."""
+        """Processes an xlsheet with embedded data.
+
+        Properties, metafields and data are consumed in order from a
+        single row iterator, so the sheet is traversed exactly once.
+        """
         self.log.debug('parsing: %s', self.name)
+        rows = self.iter_values()
+
+        # properties
+        properties = self._parse_properties(rows)
 
         # metafields
-        metafield_data = self._parse_metafield_data()
+        metafield_data = self._parse_metafield_data(rows)
 
         # fields
         _fields = [self.field_class(*args) for args in metafield_data]
 
-        # data
-        data = self._parse_data()
+        # data (the rest of the sheet is never read in schema-only mode)
+        data = None
+        if not self.option('schema_only', False):
+            data = self._parse_data(rows)
 
         # populate model
-        self.model = models.Model(self.name, _fields, data)
+        self.model = models.Model(self.name, _fields, data, properties)
 
 
 class NoDataSheet(ModelSheet):
@@ -171,8 +250,7 @@ class NoDataSheet(ModelSheet):
         """Returns list of fields."""
         self.log.debug('\tparsing %s metadata', self.name)
         _fields = []
-        for row in list(self.xlsheet.rows)[2:]:
-            args = tuple([i.value for i in row])
+        for args in self.iter_values(min_row=3):
             self.log.debug('reading: %s', args)
             _fields.append(self.field_class(*args))
         return _fields
@@ -197,37 +275,26 @@ class PropertySheet(DataSheet):
         'model',
     ]
 
-    def _parse_properties(self):
+    @property
+    def data_offset(self):
+        """Returns the number of header rows preceding the data rows.
+
+        These are the properties, the blank row after them and the
+        metafields.
+        """
+        return self.n_properties + 1 + self.n_metafields
+
+    def _parse_properties(self, rows):
         """Parse properties at top of sheet.
 
         Properties by be separated from the metadata section
-        by a blank row
+        by a blank row, which is consumed along with them.
         """
         self.log.debug('\tparsing %s properties', self.name)
         items = []
-        for row in self.xlsheet.rows:
-            if row[0].value and row[1].value:
-                items.append((row[0].value, row[1].value))
+        for row in list(islice(rows, self.n_properties + 1)):
+            if row[0] and row[1]:
+                items.append((row[0], row[1]))
             else:
                 break
         return OrderedDict(items)
-
-    def parse(self):
-        """Processes an xlsheet with embedded data."""
-        self.log.debug('parsing: %s', self.name)
-        offset = self.n_properties + 1
-
-        # properties
-        properties = self._parse_properties()
-
-        # metafields
-        metafield_data = self._parse_metafield_data(offset)
-
-        # fields
-        _fields = [self.field_class(*args) for args in metafield_data]
-
-        # data
-        data = self._parse_data(offset)
-
-        # populate model
-        self.model = models.Model(self.name, _fields, data, properties)
@@ -3,12 +3,15 @@
 This basically means that they can then be converted into other formats.
 """
 
-import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import openpyxl
 
 from . import sheets
 from .. import abstract
+from ...common.context_managers import Worker
 from ...config import Config
 
 # ----------------------------------------------------------
@@ -25,50 +28,135 @@ class ExcelToModel(abstract.SchemaReader):
         Place reader specific instance variable here
         """
         self.n_args = len(Config.METAFIELDS)
-        self.workbook = openpyxl.load_workbook(self.uri, data_only=True)
+        self.jobs = min(Worker.jobs(self.options), os.cpu_count() or 1)
+        # streaming mode keeps memory flat by reading rows lazily, and
+        # parallel parsing only needs the parent to classify sheets
+        self.read_only = bool(self.option('streaming', False)) or self.jobs > 1
+        self.workbook = openpyxl.load_workbook(
+            self.uri, read_only=self.read_only, data_only=True)
 
     def _add_model_sheet(self, xlsheet, sheet_class):
         """Helper function to add model_sheet."""
-        model_sheet = sheet_class(xlsheet, self.options)
+        model_sheet = sheet_class(xlsheet, self.options, self.uri)
         model_sheet.parse()
         self.schema.models.append(model_sheet.model)
 
+    def _get_sheet_class(self, name, sheet):
+        """Returns the model sheet class matching the layout of sheet."""
+        has_properties = lambda sheet: sheet.cell(1, 1).value == 'app'
+        id_in_cell = lambda sheet, row, col: sheet.cell(row, col).value == 'id'
+
+        # no data
+        if id_in_cell(sheet, 3, 1):
+            return sheets.NoDataSheet
+
+        # properties with data with left header
+        if has_properties(sheet):
+            return sheets.PropertySheet
+
+        # data with left header
+        if id_in_cell(sheet, self.n_args, 2):
+            return sheets.DataSheet
+
+        from ...common.exceptions import SchemaParsingError
+        error_msg = f'Cannot parse Excel file - unrecognized format in sheet "{name}"'
+        self.log.critical(error_msg)
+        raise SchemaParsingError(error_msg, file_path=self.uri, sheet_name=name)
+
+    def _add_model_sheets_parallel(self, model_sheets, jobs):
+        """Parses model sheets in worker processes preserving sheet order.
+
+        Each worker opens the workbook once (see :py:func:`open_workbook`)
+        and parses all the sheets it is handed from it.
+        """
+        names = [name for name, _ in model_sheets]
+        sheet_classes = [sheet_class for _, sheet_class in model_sheets]
+        self.log.debug('parsing %s sheets with %s jobs', len(names), jobs)
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=open_workbook,
+                                 initargs=(self.uri,)) as executor:
+            self.schema.models.extend(executor.map(
+                parse_model_sheet, repeat(self.uri), names, sheet_classes,
+                repeat(self.options)))
+
     def process(self):
         """Main process for xl to sql conversion.
 
-        1. Check 1st sheet for format to decide which way to go.
+        1. Check each sheet for format to decide which way to go.
 
-        2. Dispatch to respective subprocessing function.
+        2. Dispatch to respective subprocessing function, in worker
+           processes if the ``jobs`` option (capped by the number of
+           cpus) is greater than 1 and there is more than one model sheet
+           (unless already running in a worker, see
+           :py:class:`xlschema.common.context_managers.Worker`).
         """
-        has_properties = lambda sheet: sheet.cell(1, 1).value == 'app'
-        id_in_cell = lambda sheet, row, col: sheet.cell(row, col).value == 'id'
-        nargs = lambda col: '{}{}'.format(col, self.n_args)
-
-        for name in self.workbook.sheetnames:
-            # sheet = self.workbook.get_sheet_by_name(name)
-            sheet = self.workbook[name]
+        try:
+            model_sheets = []
+            for name in self.workbook.sheetnames:
+                # sheet = self.workbook.get_sheet_by_name(name)
+                sheet = self.workbook[name]
+
+                if name == self.config.ENUMS_SHEET:
+                    enum_sheet = sheets.EnumSheet(sheet, self.options)
+                    enum_sheet.parse()
+                    self.schema.enums.update(enum_sheet.enums)
+                else:
+                    model_sheets.append(
+                        (name, self._get_sheet_class(name, sheet)))
 
-            if name == self.config.ENUMS_SHEET:
-                enum_sheet = sheets.EnumSheet(sheet, self.options)
-                enum_sheet.parse()
-                self.schema.enums.update(enum_sheet.enums)
+            jobs = min(self.jobs, len(model_sheets))
+            if jobs > 1:
+                self._add_model_sheets_parallel(model_sheets, jobs)
             else:
-                # no data
-                if id_in_cell(sheet, 3, 1):
-                    self._add_model_sheet(sheet, sheets.NoDataSheet)
+                for name, sheet_class in model_sheets:
+                    self._add_model_sheet(self.workbook[name], sheet_class)
 
-                # properties with data with left header
-                elif has_properties(sheet):
-                    self._add_model_sheet(sheet, sheets.PropertySheet)
+            self.post_process(self.workbook.sheetnames)
+        finally:
+            if self.read_only:
+                # read-only workbooks keep the source file open until closed
+                self.workbook.close()
 
-                # data with left header
-                elif id_in_cell(sheet, self.n_args, 2):
-                    self._add_model_sheet(sheet, sheets.DataSheet)
 
-                else:
-                    from ...common.exceptions import SchemaParsingError
-                    error_msg = f'Cannot parse Excel file - unrecognized format in sheet "{name}"'
-                    self.log.critical(error_msg)
-                    raise SchemaParsingError(error_msg, file_path=self.uri, sheet_name=name)
+# read-only workbook of a worker process: (uri, workbook)
+_worker_workbook = (None, None)
+
+
+def open_workbook(uri):
+    """Opens the read-only workbook used by parse_model_sheet in this process.
+
+    Used as process pool initializer so that each worker parses the
+    archive and shared strings once rather than once per sheet. The
+    workbook stays open for the lifetime of the worker process.
 
-        self.post_process(self.workbook.sheetnames)
+    :param uri: path to the xlsx file
+    """
+    global _worker_workbook  # pylint: disable=global-statement
+    _worker_workbook = (
+        uri, openpyxl.load_workbook(uri, read_only=True, data_only=True))
+
+
+def parse_model_sheet(uri, name, sheet_class, options=None):
+    """Parses a single model sheet of a workbook and returns its model.
+
+    This is the unit of work of parallel parsing. It uses the workbook
+    opened by :py:func:`open_workbook` in this process, or opens (and
+    closes) its own read-only workbook if there is none for uri.
+
+    :param uri: path to the xlsx file
+    :param name: name of the sheet to parse
+    :param sheet_class: :py:class:`xlschema.readers.xlsx.sheets.ModelSheet` subclass
+    :param options: optional dict-like namespace
+    """
+    worker_uri, workbook = _worker_workbook
+    if worker_uri == uri:
+        model_sheet = sheet_class(workbook[name], options, uri)
+        model_sheet.parse()
+        return model_sheet.model
+    workbook = openpyxl.load_workbook(uri, read_only=True, data_only=True)
+    try:
+        model_sheet = sheet_class(workbook[name], options, uri)
+        model_sheet.parse()
+    finally:
+        workbook.close()
+    return model_sheet.model
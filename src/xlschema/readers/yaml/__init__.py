@@ -1,7 +1,10 @@
 """DB to Model SchemaReader."""
-import yaml
+from functools import partial
+from pathlib import Path
 
 from ... import fields, models
+from ...common import yaml_io
+from ...rows import LazyRows, StreamingRows
 from .. import abstract
 
 # ----------------------------------------------------------
@@ -10,7 +13,14 @@ from .. import abstract
 
 
 class YamlToModel(abstract.SchemaReader):
-    """Parses yaml files into relational models."""
+    """Parses yaml files into relational models.
+
+    Inline ``data`` rows are converted while parsing. A model's ``data``
+    may also name a sidecar yaml file (relative to the spec) holding its
+    rows as a sequence, optionally split over several documents. Sidecar rows are parsed one at a time when ``model.data``
+    is iterated, and are never held in memory with the ``streaming``
+    option.
+    """
 
     def preprocess(self):
         """Runs before main process method for conversion.
@@ -19,8 +29,8 @@ class YamlToModel(abstract.SchemaReader):
         """
         with open(self.uri, 'r') as stream:
             try:
-                self.yaml = yaml.safe_load(stream=stream)
-            except yaml.YAMLError as exc:
+                self.yaml = yaml_io.load(stream)
+            except yaml_io.YAMLError as exc:
                 self.log.error(str(exc))
                 raise
 
@@ -34,6 +44,26 @@ class YamlToModel(abstract.SchemaReader):
             _data.append(entry)
         return _data
 
+    def _get_model_rows(self, model):
+        """Retrieves data rows as tuples in order of fields."""
+        if model['data'] and isinstance(model['data'][0], dict):
+            return self._get_model_data(model)
+        return [tuple(row) for row in model['data']]
+
+    def _get_sidecar_path(self, model):
+        """Returns the path of the sidecar data file of model."""
+        return Path(self.uri).parent / model['data']
+
+    @staticmethod
+    def _iter_sidecar_rows(path, fieldnames):
+        """Yields data rows of a sidecar file as tuples in order of fields."""
+        with open(path) as stream:
+            for row in yaml_io.iter_items(stream):
+                if isinstance(row, dict):
+                    yield tuple(row[f] for f in fieldnames)
+                else:
+                    yield tuple(row)
+
     def _get_enums(self):
         """Retrieve enums from yaml entries."""
         if 'enums' not in self.yaml:
@@ -65,17 +95,29 @@ class YamlToModel(abstract.SchemaReader):
                 model['properties'] = {}
 
             # check for data
-            if 'data' not in model:
+            if 'data' not in model or self.option('schema_only', False):
                 model['data'] = []
 
-            if model['data'] and isinstance(model['data'][0], dict):
-                rows = self._get_model_data(model)
+            _fields = [fields.Field.from_dict(d) for d in model['fields']]
+
+            # inline rows are already in memory and are converted (and
+            # validated) here; sidecar rows are only read on demand
+            if isinstance(model['data'], str):
+                # parsed schemas with sidecar data are not cached
+                self.cacheable = False
+                loader = partial(self._iter_sidecar_rows,
+                                 self._get_sidecar_path(model),
+                                 [d['name'] for d in model['fields']])
+                if self.option('streaming', False):
+                    rows = StreamingRows(loader)
+                else:
+                    rows = LazyRows(loader)
             else:
-                rows = [tuple(row) for row in model['data']]
+                rows = self._get_model_rows(model)
 
             self.schema.models.append(models.Model(
                 name=model['name'],
-                fields=[fields.Field.from_dict(d) for d in model['fields']],
+                fields=_fields,
                 properties=model['properties'],
                 data=rows,
             ))
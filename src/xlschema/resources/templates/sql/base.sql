@@ -25,9 +25,18 @@ create table ${model.name}
 % for model in data.schema.models:
 % if model.data:
 
+% if data.batch_size:
+begin;
+% for values in data.batches(model.data):
+insert into ${model.name} values
+${values};
+% endfor
+commit;
+% else:
 % for row in model.data:
 insert into ${model.name} values ${data.process(row)};
 % endfor
+% endif
 
 % endif
 % endfor
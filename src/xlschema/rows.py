@@ -0,0 +1,345 @@
+"""Row containers for model data.
+
+:py:attr:`xlschema.models.Model.data` is usually a plain list of rows,
+but readers may use the containers in this module to defer reading rows
+until a writer actually asks for them, or to stream them without ever
+holding a whole table in memory, or to store rows column by column::
+
+    LazyRows
+    StreamingRows
+    ColumnStore
+"""
+import threading
+from array import array
+from functools import partial
+from itertools import islice
+
+
+class LazyRows:
+    """A list-like sequence of rows which are read from source on first use.
+
+    Writers which never touch ``model.data`` never trigger the loader,
+    so pure code generation runs skip reading rows altogether.
+    """
+
+    def __init__(self, loader, factory=list):
+        """Class constructor.
+
+        :param loader: callable returning an iterable of rows
+        :type loader: Callable[[], Iterable[tuple]]
+
+        :param factory: callable building the row container from the rows
+        :type factory: Callable[[Iterable[tuple]], Sequence[tuple]]
+        """
+        self.loader = loader
+        self.factory = factory
+        self._rows = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        state = 'loaded' if self.is_loaded else 'pending'
+        return "<{} ({})>".format(self.__class__.__name__, state)
+
+    def __reduce__(self):
+        # pickling materializes the rows into a plain list
+        return (list, (self.load(),))
+
+    @property
+    def is_loaded(self) -> bool:
+        """Returns True if rows have been read from source."""
+        return self._rows is not None
+
+    def load(self):
+        """Reads rows from source (once) and returns them as a list."""
+        if self._rows is None:
+            with self._lock:
+                if self._rows is None:
+                    self._rows = self.factory(self.loader())
+        return self._rows
+
+    def append(self, row):
+        """Appends a row (loading existing rows first)."""
+        self.load().append(row)
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def __bool__(self):
+        return bool(self.load())
+
+    def __getitem__(self, index):
+        return self.load()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, LazyRows):
+            other = other.load()
+        return self.load() == other
+
+
+class StreamingRows:
+    """A re-iterable sequence of rows which are streamed, never cached.
+
+    Every iteration calls the loader afresh, so memory use is bounded by
+    what the loader buffers (e.g. one fetch batch) rather than by the
+    size of the source. Writers which iterate over ``model.data`` consume
+    rows incrementally.
+
+    There is deliberately no ``len()``: it would have to stream the whole
+    source and would be called implicitly by ``list()``. Use
+    :py:meth:`count` instead.
+
+    Truth testing (``if model.data``) asks ``probe`` whether the source
+    has any rows, or else starts the loader and reads its first row. The
+    answer is remembered, so the source is only probed once.
+    """
+
+    def __init__(self, loader, probe=None):
+        """Class constructor.
+
+        :param loader: callable returning a fresh iterable of rows per call
+        :type loader: Callable[[], Iterable[tuple]]
+
+        :param probe: cheap callable returning True if there are any rows
+        :type probe: Callable[[], bool]
+        """
+        self.loader = loader
+        self.probe = probe
+        self._exists = None
+
+    def __repr__(self):
+        return "<{} (streaming)>".format(self.__class__.__name__)
+
+    def __reduce__(self):
+        # pickling materializes the rows into a plain list
+        return (list, (self.load(),))
+
+    @property
+    def is_loaded(self) -> bool:
+        """Streamed rows are never held in memory."""
+        return False
+
+    def load(self):
+        """Reads all rows from source into a new list (not cached)."""
+        return list(self.loader())
+
+    def count(self) -> int:
+        """Returns the number of rows by streaming through them."""
+        return sum(1 for _ in self)
+
+    def append(self, row):
+        """Streamed rows are read-only."""
+        raise TypeError("cannot append to streamed rows")
+
+    def __iter__(self):
+        return iter(self.loader())
+
+    def exists(self) -> bool:
+        """Returns True if the source has any rows (probed only once)."""
+        if self._exists is None:
+            self._exists = self._probe()
+        return self._exists
+
+    def _probe(self):
+        if self.probe is not None:
+            return bool(self.probe())
+        rows = iter(self.loader())
+        try:
+            return next(rows, None) is not None
+        finally:
+            # release the underlying cursor early
+            if hasattr(rows, 'close'):
+                rows.close()
+
+    def __bool__(self):
+        return self.exists()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            return self.load()[index]
+        try:
+            return next(islice(self, index, None))
+        except StopIteration:
+            raise IndexError('row index out of range')
+
+    def __eq__(self, other):
+        return self.load() == list(other)
+
+
+class ColumnStore:
+    """A list-like sequence of rows stored as one column per field.
+
+    Columns of numeric and boolean fields are kept in typed
+    :py:class:`array.array` columns, which take a fraction of the memory
+    of a list of python objects. ``None`` values and ints in float columns
+    (e.g. whole numbers read from xlsx) are stored in the array too, with
+    a per-row tag recording the original value, so rows always read back
+    unchanged. A column only falls back to a plain list when it receives
+    a value its array cannot represent (e.g. a str or an int too large).
+
+    >>> store = ColumnStore(['int', 'float', 'str'], [(1, 1.5, 'a'), (None, 2, None)])
+    >>> list(store)
+    [(1, 1.5, 'a'), (None, 2, None)]
+    >>> store.column(1)
+    array('d', [1.5, 2.0])
+    """
+
+    # ftype -> (array typecode, exact python type of values)
+    TYPECODES = {
+        'int': ('q', int),
+        'serial': ('q', int),
+        'bool': ('b', bool),
+        'float': ('d', float),
+        'double': ('d', float),
+    }
+
+    # row tags of typed columns
+    VALUE, NULL, INT = 0, 1, 2
+
+    def __init__(self, ftypes, rows=()):
+        """Class constructor.
+
+        :param ftypes: field types (:py:attr:`Field.ftype`) of the columns
+        :type ftypes: List[str]
+
+        :param rows: optional initial rows
+        :type rows: Iterable[tuple]
+        """
+        self.ftypes = list(ftypes)
+        self.columns = []
+        # per typed column: None until a row needs a tag, then a bytearray
+        self.tags = []
+        self._types = []
+        for ftype in self.ftypes:
+            typecode, pytype = self.TYPECODES.get(ftype, (None, None))
+            self.columns.append(array(typecode) if typecode else [])
+            self.tags.append(None)
+            self._types.append(pytype)
+        self._nrows = 0
+        self.extend(rows)
+
+    @classmethod
+    def from_model(cls, model, rows=()):
+        """Returns a store with columns typed after the fields of model."""
+        return cls([field.ftype for field in model.fields], rows)
+
+    def __repr__(self):
+        return "<{} ({} rows)>".format(self.__class__.__name__, self._nrows)
+
+    def _encode(self, pytype, value):
+        """Returns (tag, stored value) or (None, None) if not storable."""
+        if type(value) is pytype:  # pylint: disable=unidiomatic-typecheck
+            return self.VALUE, value
+        if value is None:
+            return self.NULL, pytype()
+        if pytype is float and type(value) is int:  # pylint: disable=unidiomatic-typecheck
+            try:
+                stored = float(value)
+            except OverflowError:
+                return None, None
+            if stored == value:  # only ints a double holds exactly
+                return self.INT, stored
+        return None, None
+
+    def _decode(self, pytype, value, tag=VALUE):
+        """Returns the original value of a stored value and its tag."""
+        if tag == self.NULL:
+            return None
+        if tag == self.INT:
+            return int(value)
+        return bool(value) if pytype is bool else value
+
+    def _demote(self, index):
+        """Replaces a typed column by a list of python values."""
+        self.columns[index] = list(self.values(index))
+        self.tags[index] = None
+        self._types[index] = None
+
+    def _append_typed(self, index, pytype, value):
+        """Appends value to a typed column, returns False if not storable."""
+        tag, stored = self._encode(pytype, value)
+        if tag is None:
+            return False
+        try:
+            self.columns[index].append(stored)
+        except OverflowError:
+            return False
+        tags = self.tags[index]
+        if tags is None and tag != self.VALUE:
+            tags = self.tags[index] = bytearray(self._nrows)
+        if tags is not None:
+            tags.append(tag)
+        return True
+
+    def append(self, row):
+        """Appends a row.
+
+        Like writers zipping rows with fields, rows longer than the number
+        of columns are truncated; shorter rows are padded with ``None``.
+        """
+        ncols = len(self.columns)
+        if len(row) != ncols:
+            row = tuple(row[:ncols]) + (None,) * (ncols - len(row))
+        for i, value in enumerate(row):
+            pytype = self._types[i]
+            if pytype is not None:
+                if self._append_typed(i, pytype, value):
+                    continue
+                self._demote(i)
+            self.columns[i].append(value)
+        self._nrows += 1
+
+    def extend(self, rows):
+        """Appends rows."""
+        for row in rows:
+            self.append(row)
+
+    def column(self, index):
+        """Returns the storage of the column at index (an array or a list).
+
+        Typed columns hold placeholders for ``None`` values, see ``tags``.
+        """
+        return self.columns[index]
+
+    def values(self, index):
+        """Returns an iterator over the values of the column at index."""
+        column, pytype = self.columns[index], self._types[index]
+        if pytype is None:
+            return iter(column)
+        tags = self.tags[index]
+        if tags is None:
+            return map(bool, column) if pytype is bool else iter(column)
+        return map(partial(self._decode, pytype), column, tags)
+
+    def _cell(self, col, index):
+        value = self.columns[col][index]
+        pytype = self._types[col]
+        if pytype is None:
+            return value
+        tags = self.tags[col]
+        tag = self.VALUE if tags is None else tags[index]
+        return self._decode(pytype, value, tag)
+
+    def __len__(self):
+        return self._nrows
+
+    def __bool__(self):
+        return self._nrows > 0
+
+    def __iter__(self):
+        columns = [self.values(i) for i in range(len(self.columns))]
+        return zip(*columns) if columns else iter(())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._nrows))]
+        if index < 0:
+            index += self._nrows
+        if not 0 <= index < self._nrows:
+            raise IndexError('row index out of range')
+        return tuple(self._cell(col, index) for col in range(len(self.columns)))
+
+    def __eq__(self, other):
+        return list(self) == [tuple(row) for row in other]
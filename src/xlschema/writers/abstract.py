@@ -8,9 +8,13 @@ abstract ``Writer`` class in this module::
             MultiTemplateWriter
 """
 
+import functools
+import io
 import logging
 import os
 
+from mako.runtime import Context
+
 from .. import fields, models
 from ..common.mixins import CommandMixin
 from ..common.templating import TemplateEngine
@@ -88,6 +92,30 @@ class SchemaWriter(CommandMixin):
         """
 
 
+SAFE_TEMPLATE_TYPES = (str, int, float, bool, list, dict, tuple, type(None))
+SAFE_TEMPLATE_CLASSES = {'Schema', 'Model', 'Enum', 'Field', 'Text', 'Config'}
+SAFE_TEMPLATE_MODULES = (
+    'xlschema.common.dict', 'xlschema.config', 'xlschema.models',
+    'xlschema.fields', 'xlschema.common.text'
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_safe_template_type(cls) -> bool:
+    """Check if values of a type are allowed in template contexts."""
+    # Allow basic types (exact types only, not subclasses)
+    if cls in SAFE_TEMPLATE_TYPES:
+        return True
+
+    # Allow xlschema model classes
+    if cls.__name__ in SAFE_TEMPLATE_CLASSES:
+        return True
+
+    # Allow xlschema objects (by module)
+    module_name = getattr(cls, '__module__', '') or ''
+    return module_name.startswith(SAFE_TEMPLATE_MODULES)
+
+
 class TemplateWriter(SchemaWriter):
     """Uses templates to write models to code formats."""
 
@@ -95,10 +123,24 @@ class TemplateWriter(SchemaWriter):
 
     def render(self, **kwds):
         """Generic mako template renderer with security validation."""
+        buffer = io.StringIO()
+        self.render_to(buffer, **kwds)
+        return buffer.getvalue()
+
+    def render_to(self, stream, **kwds):
+        """Renders the template directly into stream.
+
+        The stream is used as the mako context buffer, so output is
+        written as it is produced and never held in memory as a whole.
+
+        :param stream: writable text stream (e.g. an open file)
+        :type stream: :py:class:`io.TextIOBase`
+        """
         from ..common.exceptions import TemplateRenderingError
 
         # Validate template context
-        safe_kwds = self._validate_template_context(kwds)
+        safe_kwds = self._validate_template_context(
+            kwds, deep=getattr(self.options, 'deep_validate', False))
         safe_kwds.update(dict(data=self))
 
         self.log.debug('rendering: %s', self.schema.name)
@@ -112,7 +154,7 @@ class TemplateWriter(SchemaWriter):
 
         try:
             template = self.config.TEMPLATE_ENV.get_template(validated_template)
-            return str(template.render(**safe_kwds))
+            template.render_context(Context(stream, **safe_kwds))
         except Exception as e:
             error_msg = f"Template rendering failed: {e}"
             self.log.error(error_msg)
@@ -149,10 +191,15 @@ class TemplateWriter(SchemaWriter):
 
         return template_name
 
-    def _validate_template_context(self, context: dict) -> dict:
+    def _validate_template_context(self, context: dict, deep: bool = False) -> dict:
         """Validate template context data for security.
 
+        By default only the type of each value is checked, so the cost
+        does not depend on the size of the data. With ``deep`` the items
+        of lists, tuples and dicts are checked recursively as well.
+
         :param context: template context dictionary
+        :param deep: also check the contents of collections
         :returns: validated context dictionary
         :raises TemplateRenderingError: if context is invalid
         """
@@ -179,53 +226,32 @@ class TemplateWriter(SchemaWriter):
                 continue
 
             # Basic value validation
-            if self._is_safe_template_value(value):
+            if self._is_safe_template_value(value, deep):
                 safe_context[key] = value
             else:
                 self.log.warning("Skipping potentially dangerous context value for key: %s", key)
 
         return safe_context
 
-    def _is_safe_template_value(self, value) -> bool:
+    def _is_safe_template_value(self, value, deep: bool = False) -> bool:
         """Check if a value is safe for template rendering.
 
         :param value: value to check
+        :param deep: also check the contents of collections
         :returns: True if value is safe
         """
-        # Allow basic types
-        safe_types = (str, int, float, bool, list, dict, tuple, type(None))
-
-        if type(value) in safe_types:
-            # For collections, recursively check contents
+        if not _is_safe_template_type(type(value)):
+            return False
+        if deep:
             if isinstance(value, (list, tuple)):
-                return all(self._is_safe_template_value(item) for item in value)
-            elif isinstance(value, dict):
+                return all(self._is_safe_template_value(item, deep)
+                           for item in value)
+            if isinstance(value, dict):
                 return all(
-                    isinstance(k, str) and self._is_safe_template_value(v)
+                    isinstance(k, str) and self._is_safe_template_value(v, deep)
                     for k, v in value.items()
                 )
-            return True
-
-        # Allow specific xlschema model classes and objects
-        if hasattr(value, '__class__'):
-            class_name = value.__class__.__name__
-            module_name = getattr(value.__class__, '__module__', '')
-
-            # Allow xlschema model classes
-            safe_classes = {'Schema', 'Model', 'Enum', 'Field', 'Text', 'Config'}
-            if class_name in safe_classes:
-                return True
-
-            # Allow xlschema objects (by module)
-            if module_name and module_name.startswith('xlschema.'):
-                safe_modules = {
-                    'xlschema.common.dict', 'xlschema.config', 'xlschema.models',
-                    'xlschema.fields', 'xlschema.common.text'
-                }
-                if any(module_name.startswith(mod) for mod in safe_modules):
-                    return True
-
-        return False
+        return True
 
     def write(self, to_path=None):
         """Basic template to file writer.
@@ -237,9 +263,26 @@ class TemplateWriter(SchemaWriter):
             path = to_path
         else:
             path = self.path
+        self.log.info("writing: %s", path)
+        self.render_file(path)
+
+    def render_file(self, path, **kwds):
+        """Renders the template straight into the file at path.
+
+        :param path: target file path
+        :type path: str
+
+        :param kwds: keyword arguments passed to :py:meth:`render_to`
+        :type kwds: dict
+        """
         with open(path, 'w') as target:
-            self.log.info("writing: %s", path)
-            target.write(self.render())
+            try:
+                self.render_to(target, **kwds)
+            except Exception:
+                # do not leave partial output behind
+                target.seek(0)
+                target.truncate()
+                raise
 
 
 class MultiTemplateWriter(TemplateWriter):
@@ -252,8 +295,7 @@ class MultiTemplateWriter(TemplateWriter):
             output = to_path
         else:
             output = self.options.output
-        if not os.path.exists(output):
-            os.makedirs(output)
+        os.makedirs(output, exist_ok=True)
         path = os.path.join(output, _path)
         self.log.info("writing: %s", path)
         return path
@@ -262,5 +304,4 @@ class MultiTemplateWriter(TemplateWriter):
         """Overriden write method writes 1 model to 1 file in root path."""
         for model in self.schema.models:
             path = self._get_path(model.name.classname, to_path)
-            with open(path, 'w') as target:
-                target.write(self.render(model=model, is_model_template=True))
+            self.render_file(path, model=model, is_model_template=True)
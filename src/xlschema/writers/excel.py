@@ -94,7 +94,8 @@ class ExcelWriter(SchemaWriter, ToExcelMixin):
             nrows_data = self.n_args  # set number of empty rows for symmetry
             self.log.warning("no data, writing validation rules only")
         else:
-            nrows_data = len(model.data)
+            # rows were already written (streamed rows have no len)
+            nrows_data = sheet.max_row - self.n_args
 
         for i, field in enumerate(model.fields, 1):
             col = self.xl_column(i + 1)
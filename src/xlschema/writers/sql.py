@@ -14,7 +14,9 @@ Inheritance structure::
 
 
 import datetime
+import itertools
 import os
+import sqlite3
 
 from .. import fields
 from ..common.text import Text
@@ -36,30 +38,43 @@ class SqlWriter(TemplateWriter):
     def populate(self):
         """Populate DB."""
 
+    @property
+    def batch_size(self):
+        """Returns the number of rows per insert statement (0: one per row)."""
+        return getattr(self.options, 'batch_size', None) or 0
+
+    def batches(self, rows):
+        """Yields the values lists of multi-row inserts of batch_size rows.
+
+        :param rows: model data rows (may be a single-pass iterable)
+        """
+        rows = iter(rows)
+        while True:
+            batch = list(itertools.islice(rows, self.batch_size))
+            if not batch:
+                return
+            yield ',\n'.join(self.process(row) for row in batch)
+
+    def cell(self, value):
+        """Used to transform individual elements during data inserts.
+
+        Returns None for null values.
+        """
+        if value in [None, 'n/a', '']:
+            return None
+        elif isinstance(value, str):
+            if self.options.clean:
+                return Text(value).clean()
+            return value
+        elif isinstance(value, (datetime.datetime, datetime.date)):
+            return str(value)
+        return value
+
     def process(self, row):
         """Use for cell operations during inserts in sql (postgres, sqlite)."""
-        def _cell(value):
-            """Used to transform individual elements during data inserts."""
-            # pylint: disable=too-many-return-statements
-            # try:
-            if value in [None, 'n/a', '']:
-                return 'null'
-            elif isinstance(value, str):
-                if self.options.clean:
-                    return Text(value).clean()
-                return value
-            elif isinstance(value, int):
-                return value
-            elif isinstance(value, datetime.datetime):
-                return str(value)
-            elif isinstance(value, datetime.date):
-                return str(value)
-            else:
-                return value
-            # except UnicodeEncodeError as err:
-                # self.log.exception('Error: %s: %s', err, row)
-
-        return str(tuple(_cell(i) for i in row)).replace("'null'", 'null')
+        values = ('null' if value is None else value
+                  for value in map(self.cell, row))
+        return str(tuple(values)).replace("'null'", 'null')
 
 
 @register
@@ -166,10 +181,66 @@ class SqliteWriter(SqlWriter):
     field_class = fields.SqliteField
     method = 'sqlite'
 
+    # applied for the duration of populate: the database is rebuilt from
+    # scratch, so syncing to disk is skipped, but the (in memory) rollback
+    # journal is kept so that a failed load is rolled back cleanly
+    LOAD_PRAGMAS = {
+        'journal_mode': 'memory',
+        'synchronous': 'off',
+    }
+
+    @property
+    def db_path(self):
+        """Returns the path of the sqlite database populated by the writer."""
+        return os.path.join(self.options.output,
+                            '{}_{}.db'.format(self.schema.name, self.method))
+
     def populate(self):
-        """Populate into sqlite db."""
-        self.log.debug('populating: %s', self.path)
-        sqlite_db = os.path.join(self.options.output,
-                                 '{}_{}.db'.format(self.schema.name,
-                                                   self.method))
-        self.cmd('sqlite3 {} < {}', sqlite_db, self.path, fail_ok=True)
+        """Populate sqlite db in-process from the models.
+
+        Tables are created from the model definitions and data rows are
+        loaded with ``executemany`` in a single transaction. A failed load
+        is rolled back and its error raised.
+        """
+        self.log.debug('populating: %s', self.db_path)
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            for pragma, value in self.LOAD_PRAGMAS.items():
+                conn.execute('pragma {} = {}'.format(pragma, value))
+            conn.execute('begin')
+            try:
+                self._load(conn)
+            except Exception:
+                # sqlite may already have rolled back (e.g. on a full disk)
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            conn.execute('commit')
+        except sqlite3.Error as err:
+            self.log.error('populate failed: %s: %s', self.db_path, err)
+            raise
+        finally:
+            conn.close()
+
+    def _load(self, conn):
+        """Creates tables and inserts data rows using connection conn."""
+        for model in self.schema.models:
+            if not self.options.update_only:
+                conn.execute('drop table if exists {}'.format(model.name))
+                conn.execute('create table {}\n(\n{}\n)'.format(
+                    model.name, '\n'.join(model.definitions)))
+            if self.options.models_only or not model.data:
+                continue
+            statement = 'insert into {} ({}) values ({})'.format(
+                model.name,
+                ', '.join(model.fieldnames),
+                ', '.join('?' for _ in model.fieldnames))
+            conn.executemany(statement, (
+                tuple(self.param(value) for value in row)
+                for row in model.data))
+
+    def param(self, value):
+        """Transforms a cell value into an sqlite3 query parameter."""
+        value = self.cell(value)
+        # sqlite3 only adapts exact str instances
+        return str(value) if isinstance(value, str) else value
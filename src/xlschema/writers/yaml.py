@@ -7,9 +7,8 @@ Inheritance structure::
             YamlWriter
 """
 
-import yaml
-
 from .. import fields
+from ..common import yaml_io
 from ..config import register
 from .abstract import TemplateWriter
 
@@ -31,6 +30,6 @@ class YamlWriter(TemplateWriter):
         """Validate yaml using pyyaml."""
         self.log.debug('validating and rewriting %s', self.path)
         with open(self.path) as fopen:
-            yml = yaml.load(stream=fopen, Loader=yaml.SafeLoader)
+            yml = yaml_io.load(fopen)
         with open(self.path, 'w') as fwrite:
-            yaml.dump(yml, stream=fwrite, default_flow_style=False)
+            yaml_io.dump(yml, stream=fwrite)
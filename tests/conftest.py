@@ -1,8 +1,13 @@
 import argparse
 import os
+import shutil
+import tempfile
 
 import pytest
 
+# keep test runs out of the user's cache (read when xlschema is imported)
+os.environ['XLSCHEMA_CACHE'] = tempfile.mkdtemp(prefix='xlschema-test-cache-')
+
 import xlschema
 
 # HELPERS
@@ -50,7 +55,8 @@ METHODS_PROPS = [
 
 ROOT = 'tests/data'
 
-DB_DIR = join(ROOT, 'db')
+# test databases are (re)created outside of the source tree
+DB_DIR = tempfile.mkdtemp(prefix='xlschema-test-db-')
 FIXTURES = join(ROOT, 'fixtures')
 LOGS_DIR = join(ROOT, 'logs')
 
@@ -75,7 +81,7 @@ FROM_URI = cmd([XLSCHEMA_OUT, 'from_uri'])
 spec = lambda name: join(SPEC_DIR, name+'.yml')
 xlsx = lambda name: join(XL_DIR, name+'.xlsx')
 yaml = lambda name: join(YL_DIR, name+'.yml')
-sqldb = lambda name: join('sqlite:///', DB_DIR, name+'.sqlite')
+sqldb = lambda name: 'sqlite:///' + join(DB_DIR, name+'.sqlite')
 split_in = lambda name: join(SPLIT_IN_DIR, name+'.xlsx')
 split_out = lambda name: join(SPLIT_OUT_DIR, name+'.xlsx')
 dual = lambda name: [xlsx(name), yaml(name)]
@@ -112,6 +118,7 @@ XL_FILES = [join(XL_DIR, f) for f in os.listdir(XL_DIR)
             if f.endswith('.xlsx') and f not in XL_SKIP_FILES]
 
 TEST_DB = sqldb('test')
+DEFAULT_DB = 'sqlite:///tests/data/db/test.sqlite'  # Config.DB_URI
 POSTGRES_DB = 'postgresql://sa:sa@localhost:5432/db'
 
 # options
@@ -209,6 +216,12 @@ def app_check(fname, method, options=None, **kwds):
 # FIXTURES
 # ----------------------------------------------------------------------
 
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_tmp_dirs():
+    yield
+    shutil.rmtree(DB_DIR, ignore_errors=True)
+    shutil.rmtree(os.environ['XLSCHEMA_CACHE'], ignore_errors=True)
+
 @pytest.fixture(scope="module")
 def populate_db():
     shell(['sqlite3', join(DB_DIR, 'test.sqlite'), '<', join(FIXTURES,'test.sql')])
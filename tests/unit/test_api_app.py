@@ -2,7 +2,7 @@ import pytest
 
 import xlschema
 from conftest import (
-    SCHEMA_YAML, METHODS,
+    SCHEMA_YAML, METHODS, OPTIONS_DEFAULT, nspace,
     exists, dir_exists, get_app, cleanup, check, app_check, to_output
 )
 
@@ -50,6 +50,37 @@ def test_app_writers_property(app):
     writers2 = app.writers
     assert writers1[0] is writers2[0]
 
+def test_app_writer_cache():
+    app = get_app('node.yml')
+    writer = app.get_writer('sql/sqlite')
+    assert app.get_writer('sql/sqlite') is writer
+    assert app.writers[app.writer_types.index('sql/sqlite')] is writer
+    app.options.models_only = not app.options.models_only
+    assert app.get_writer('sql/sqlite') is not writer
+    app.options.models_only = not app.options.models_only
+    assert app.get_writer('sql/sqlite') is writer
+    app.schema = app.get_reader(app.uri, app.options).schema
+    assert app.get_writer('sql/sqlite') is not writer
+
+def test_app_writer_cache_in_place_edits():
+    from xlschema.models import Enum
+    app = get_app('node.yml')
+    writer = app.get_writer('sql/sqlite')
+    app.write('sql/sqlite')
+    assert app.get_writer('sql/sqlite') is writer
+    model = app.schema.models[0]
+    model.fields[-1].description = 'changed'
+    writer = app.get_writer('sql/sqlite')
+    assert writer.schema.models[0].fields[-1].description == 'changed'
+    model.name = 'renamed'
+    writer = app.get_writer('sql/sqlite')
+    assert writer.schema.models[0].name == 'renamed'
+    model.fields.pop()
+    assert app.get_writer('sql/sqlite') is not writer
+    writer = app.get_writer('sql/sqlite')
+    app.schema.enums['extra'] = Enum('extra', [('a', 1)])
+    assert 'extra' in app.get_writer('sql/sqlite').schema.enums
+
 def test_app_dispatch_continue(app):
     writer_types = ['not/found', 'yml/yaml']
     app.write(*writer_types)
@@ -65,3 +96,96 @@ def test_app_get_writer_error(app):
 def test_app_error():
     with pytest.raises(xlschema.XLSchemaError):
         app = get_app('./README.md')
+
+def test_app_write_parallel(tmp_path):
+    serial_dir, parallel_dir = tmp_path / 'serial', tmp_path / 'parallel'
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+    serial = get_app('node.yml', output=str(serial_dir))
+    parallel = get_app('node.yml', output=str(parallel_dir), jobs=4)
+    formats = ['sql/sqlite', 'sql/postgres', 'py/sqlalchemy', 'yml/yaml']
+    serial.write(*formats)
+    parallel.write(*formats)
+    files = sorted(p.name for p in serial_dir.iterdir())
+    assert files == sorted(p.name for p in parallel_dir.iterdir())
+    for name in files:
+        assert (serial_dir / name).read_text() == (parallel_dir / name).read_text()
+
+def test_app_write_parallel_errors(tmp_path, mocker):
+    from xlschema.common.exceptions import AggregateWriterError
+    app = get_app('node.yml', output=str(tmp_path), jobs=2)
+    for writer_type in ['sql/sqlite', 'sql/postgres']:
+        mocker.patch.object(app.get_writer(writer_type), 'write',
+                            side_effect=ValueError(writer_type))
+    with pytest.raises(AggregateWriterError) as excinfo:
+        app.write('sql/sqlite', 'yml/yaml', 'sql/postgres')
+    assert list(excinfo.value.errors) == ['sql/sqlite', 'sql/postgres']
+    assert (tmp_path / 'node_yaml.yml').exists()
+
+def test_worker_jobs():
+    from xlschema.common.context_managers import Worker
+    options = nspace(OPTIONS_DEFAULT, jobs=4)
+    assert Worker.jobs(options) == 4
+    assert Worker.jobs(nspace(OPTIONS_DEFAULT)) == 1
+    with Worker():
+        assert Worker.jobs(options) == 1
+        with Worker():
+            assert Worker.is_active()
+        assert Worker.jobs(options) == 1
+    assert not Worker.is_active()
+    assert Worker.wrap(Worker.jobs)(options) == 1
+
+def test_ordered_logs(caplog):
+    import logging
+    import threading
+    from xlschema.common.context_managers import OrderedLogs
+    log = logging.getLogger('ordered')
+    first_logged = threading.Event()
+
+    def task(name, wait):
+        if wait:
+            first_logged.wait(5)
+        log.warning(name)
+        if not wait:
+            first_logged.set()
+
+    with caplog.at_level(logging.WARNING, logger='ordered'):
+        with OrderedLogs() as logs:
+            threads = [threading.Thread(target=logs.wrap(0, task), args=('a', True)),
+                       threading.Thread(target=logs.wrap(1, task), args=('b', False))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+    assert [r.getMessage() for r in caplog.records if r.name == 'ordered'] == ['a', 'b']
+
+def test_ordered_logs_nested_threads(caplog):
+    import logging
+    from concurrent.futures import ThreadPoolExecutor
+    from xlschema.common.context_managers import OrderedLogs
+    log = logging.getLogger('ordered')
+    handler = logging.getLogger().handlers[0]
+    filters = len(handler.filters)
+
+    def inner(outer_key):
+        with OrderedLogs() as logs:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                keys = range(3)
+                funcs = [logs.wrap(k, log.warning) for k in keys]
+                msgs = ['{}{}'.format(outer_key, k) for k in keys]
+                list(executor.map(lambda f, m: f(m), funcs, msgs))
+            assert len(handler.filters) == filters + 1
+            for key in keys:
+                logs.flush(key)
+
+    with caplog.at_level(logging.WARNING, logger='ordered'):
+        with OrderedLogs() as logs:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(logs.wrap(key, inner), key)
+                           for key in 'abcd']
+            for key, future in zip('abcd', futures):
+                future.result()
+                logs.flush(key)
+    assert len(handler.filters) == filters
+    assert [r.getMessage() for r in caplog.records if r.name == 'ordered'] == \
+        ['{}{}'.format(a, k) for a in 'abcd' for k in range(3)]
@@ -0,0 +1,26 @@
+from xlschema.common.cache import FileCache
+
+
+def test_file_cache_roundtrip(tmp_path):
+    cache = FileCache('test', root=tmp_path)
+    key = cache.make_key('uri', ['a', 'b'])
+    assert cache.get(key) is None
+    cache.set(key, {'a': [1, 2]})
+    assert cache.get(key) == {'a': [1, 2]}
+    assert key != cache.make_key('uri', ['a'])
+    cache.clear()
+    assert cache.get(key, 'missing') == 'missing'
+
+def test_file_cache_corrupt_entry(tmp_path):
+    cache = FileCache('test', root=tmp_path)
+    cache.set('key', 1)
+    (tmp_path / 'test' / 'key.pickle').write_bytes(b'garbage')
+    assert cache.get('key') is None
+
+def test_file_cache_set_is_best_effort(tmp_path):
+    cache = FileCache('test', root=tmp_path)
+    assert not cache.set('key', lambda: None)
+    assert cache.get('key') is None
+    assert list((tmp_path / 'test').iterdir()) == []
+    (tmp_path / 'file').write_text('')
+    assert not FileCache('test', root=tmp_path / 'file').set('key', 1)
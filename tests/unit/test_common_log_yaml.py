@@ -60,12 +60,22 @@ logging:
         propogate: false
 '''
 
-def test_dictconfig():
-    config = yaml.safe_load(yaml_config)
-    logging.config.dictConfig(config['logging'])
+def test_dictconfig(tmp_path):
+    config = yaml.safe_load(
+        yaml_config.replace('./tests/data/logs', str(tmp_path)))
     log = logging.getLogger()
-    log.info('This is a info msg')
-    log.debug('This is a debug msg')
-    log.warning('This is a warning msg')
-    log.error('This is an error')
-    log.critical('This is a critical error')
+    handlers = list(log.handlers)
+    logging.config.dictConfig(config['logging'])
+    try:
+        log.info('This is a info msg')
+        log.debug('This is a debug msg')
+        log.warning('This is a warning msg')
+        log.error('This is an error')
+        log.critical('This is a critical error')
+    finally:
+        # do not leave file handlers logging for the rest of the session
+        for handler in log.handlers:
+            if handler not in handlers:
+                handler.close()
+        log.handlers = handlers
+    assert 'This is an error' in (tmp_path / 'errors.log').read_text()
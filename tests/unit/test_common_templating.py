@@ -1,3 +1,5 @@
+import os
+
 import pytest
 
 from conftest import (
@@ -6,7 +8,7 @@ from conftest import (
 )
 
 from xlschema.common.templating import (
-    Template, TemplateEntry, TemplateEngine)
+    Template, TemplateEntry, TemplateEngine, get_lookup, compile_templates)
 
 ENTRY_IS_ABBREV_SHALLOW = 'sql/test'
 ENTRY_IS_ABBREV_DEEP = 'py/dj/hello'
@@ -89,6 +91,27 @@ def test_engine_hashed(engine):
     assert rendered == EXPECT_RENDERED
     assert engine.hashed(rendered) == engine.hashed(EXPECT_RENDERED)
 
+def test_lookup_shared(tmp_path):
+    assert get_lookup(TEMPLATES_DIR, tmp_path) is get_lookup(
+        TEMPLATES_DIR, tmp_path)
+
+def test_compile_templates(tmp_path):
+    compiled = compile_templates(TEMPLATES_DIR, tmp_path)
+    assert 'sql/test.sql' in compiled
+    assert list(tmp_path.rglob('test.sql.py'))
+
+def test_compiled_template_recompiles_on_change(tmp_path):
+    templates = tmp_path / 'templates'
+    templates.mkdir()
+    src = templates / 'hello.txt'
+    src.write_text('hello ${world}')
+    lookup = get_lookup(templates, tmp_path / 'cache')
+    assert lookup.get_template('hello.txt').render(world='a') == 'hello a'
+    src.write_text('bye ${world}')
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert lookup.get_template('hello.txt').render(world='a') == 'bye a'
+
 # def test_compare_files():
 #     engine = TemplateEngine(root=TEMPLATES_DIR, output=OUTPUT)
 #     app = get_app("node_props.yml", options=OPTIONS_DEFAULT)
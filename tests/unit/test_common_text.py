@@ -33,3 +33,12 @@ def test_plural():
     assert Text('boy').plural() == 'boys'
     assert Text('sash').plural() == 'sashes'
     assert Text('box').plural() == 'boxes'
+
+def test_transforms_memoized():
+    from xlschema.common import text as text_module
+    text_module._classname.cache_clear()
+    assert Text('foo_bar_id').classname == 'FooBarID'
+    assert Text('foo_bar_id').classname == 'FooBarID'
+    assert isinstance(Text('foo_bar').classname, Text)
+    assert text_module._classname.cache_info().hits >= 1
+    assert Text('person').plural() == text_module.ABERRANT_PLURALS['person']
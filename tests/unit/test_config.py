@@ -1,13 +1,13 @@
 import os
 
-from conftest import TEST_DB
+from conftest import DEFAULT_DB
 
 
 def test_config_environ_baseline():
     from xlschema.config import Config
 
     assert not os.getenv('DB_URI')
-    assert Config.DB_URI == TEST_DB
+    assert Config.DB_URI == DEFAULT_DB
 
 def test_config_environ_external():
     MY_DB = 'sqlite:///my.db'
@@ -28,4 +28,20 @@ def test_config_db():
     assert db.password == None
     assert db.host == None
     assert db.port == None
-    assert db.database == TEST_DB.replace('sqlite:///', '')
+    assert db.database == DEFAULT_DB.replace('sqlite:///', '')
+
+def test_yaml_io_load_config(tmp_path):
+    from xlschema.common import yaml_io
+    path = tmp_path / 'config.yml'
+    path.write_text(yaml_io.dump({'settings': {'jobs': 1}}))
+    cfg = yaml_io.load_config(path)
+    cfg['settings']['jobs'] = 2
+    assert yaml_io.load_config(path) == {'settings': {'jobs': 1}}
+    path.write_text(yaml_io.dump({'settings': {'jobs': 10}}))
+    assert yaml_io.load_config(path)['settings']['jobs'] == 10
+
+def test_config_cache_dir_per_user():
+    from xlschema.config import Config
+
+    assert str(Config.CACHE_DIR) == os.environ['XLSCHEMA_CACHE']
+    assert Config.TEMPLATE_CACHE_DIR == Config.CACHE_DIR / 'templates'
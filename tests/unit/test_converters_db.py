@@ -10,7 +10,7 @@ def test_sqlmodel_get_types():
     expected_types = ['int', 'float', 'str', 'date', 'int']
     assert SqlToModel.get_types(row, fieldnames) == expected_types
 
-def test_db_to_model():
+def test_db_to_model(populate_db):
     app = DBToModel(TEST_DB, options=OPTIONS_TABLE)
     assert len(app.schema.models) > 0
     assert len(app.schema.types)  > 0
@@ -33,3 +33,107 @@ def test_write_from_dbapp(dbapp):
 def test_write_from_sqlapp(sqlapp):
     sqlapp.write('sql/sqlite')
     check('test_sqlite.sql')
+
+def test_db_to_model_lazy_data(populate_db):
+    app = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    model = app.schema.models[0]
+    assert not model.data.is_loaded
+    assert len(model.data) > 0
+    assert model.data.is_loaded
+
+def test_db_to_model_schema_only(populate_db):
+    from conftest import nspace
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, schema_only=True))
+    assert all(model.data == [] for model in app.schema.models)
+    assert len(app.schema.models[0].fields) > 0
+
+def test_db_to_model_streaming(populate_db):
+    from conftest import nspace
+    from xlschema.rows import StreamingRows
+    lazy = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE,
+                                            streaming=True, fetch_size=2))
+    model = app.schema.models[0]
+    assert isinstance(model.data, StreamingRows)
+    assert model.data
+    assert list(model.data) == list(lazy.schema.models[0].data)
+    assert list(model.data) == list(model.data)
+    assert model.data.count() == len(lazy.schema.models[0].data)
+    assert model.data[1] == lazy.schema.models[0].data[1]
+
+def test_db_to_model_streaming_probe(populate_db):
+    from conftest import nspace
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, streaming=True))
+    for model in app.schema.models:
+        model.data.loader = None  # truth testing must not stream rows
+        assert model.data
+
+def test_db_to_model_parallel(populate_db):
+    from concurrent.futures import wait
+    from conftest import nspace
+    serial = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, jobs=3))
+    assert not any(model.data.is_loaded for model in app.schema.models)
+    assert app.schema.models[0].data == serial.schema.models[0].data
+    wait(app.prefetched)
+    assert all(model.data.is_loaded for model in app.schema.models)
+    for m1, m2 in zip(serial.schema.models, app.schema.models):
+        assert m1.data == m2.data
+
+def test_db_to_model_no_nested_prefetch(populate_db):
+    from conftest import nspace
+    from xlschema.common.context_managers import Worker
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, jobs=3))
+    with Worker():  # e.g. a writer run by XLSchema with jobs > 1
+        assert app.schema.models[0].data
+    assert app.prefetched == []
+    assert not app.schema.models[1].data.is_loaded
+
+def test_db_to_model_reflects_requested_tables(populate_db):
+    from conftest import nspace
+    app = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, table=['person']))
+    assert list(app.meta.tables) == ['person']
+    assert [model.name for model in app.schema.models] == ['person']
+
+def test_sql_to_model_skips_reflection(populate_db):
+    app = SqlToModel(TEST_DB, options=OPTIONS_SQL)
+    assert not hasattr(app, 'meta')
+
+def test_db_to_model_reflection_cache(populate_db, tmp_path, monkeypatch, mocker):
+    from conftest import nspace
+    from sqlalchemy import MetaData
+    from xlschema.config import Config
+    monkeypatch.setattr(Config, 'CACHE_DIR', tmp_path)
+    first = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    reflect = mocker.spy(MetaData, 'reflect')
+    second = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    assert reflect.call_count == 0
+    assert list(second.meta.tables) == list(first.meta.tables)
+    assert second.schema.models[0].data == first.schema.models[0].data
+    DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, no_cache=True))
+    assert reflect.call_count == 1
+    monkeypatch.setattr('sqlalchemy.__version__', '0.0')
+    DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    assert reflect.call_count == 2
+
+def test_db_catalog_fingerprint_tracks_ddl(populate_db):
+    from sqlalchemy import text
+    app = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    before = app.catalog_fingerprint()
+    assert before == app.catalog_fingerprint()
+    with app.engine.begin() as conn:
+        conn.execute(text('create table fingerprint_probe (id integer)'))
+    try:
+        assert app.catalog_fingerprint() != before
+    finally:
+        with app.engine.begin() as conn:
+            conn.execute(text('drop table fingerprint_probe'))
+
+def test_db_to_model_columnar(populate_db):
+    from conftest import nspace
+    from xlschema.rows import ColumnStore
+    app = DBToModel(TEST_DB, options=OPTIONS_TABLE)
+    columnar = DBToModel(TEST_DB, options=nspace(OPTIONS_TABLE, columnar=True))
+    for m1, m2 in zip(app.schema.models, columnar.schema.models):
+        assert isinstance(m2.data.load(), ColumnStore)
+        assert m2.data == list(m1.data)
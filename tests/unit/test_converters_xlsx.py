@@ -2,7 +2,7 @@ import pytest
 
 from xlschema.fields.abstract import FieldError
 
-from conftest import get_app, check
+from conftest import get_app, check, xlsx
 
 def test_spreadsheets(xlapp):
     assert len(xlapp.schema.models) > 0
@@ -33,3 +33,131 @@ def test_partial_no_enums_xlsx():
     assert len(app.schema.models) > 0
     assert len(app.schema.enums) == 0
     assert len(app.schema.types) > 0
+
+@pytest.mark.parametrize('fname', ['schema.xlsx', 'django.xlsx', 'test-no-data.xlsx'])
+def test_streaming_xlsx(fname):
+    full = get_app(fname)
+    streamed = get_app(fname, streaming=True, no_cache=True,
+                       output='tests/data/output')
+    assert streamed.reader.workbook.read_only
+    for m1, m2 in zip(full.schema.models, streamed.schema.models):
+        assert m1.fieldnames == m2.fieldnames
+        assert m1.data == m2.data
+        assert m1.properties == m2.properties
+    assert full.schema.enums.keys() == streamed.schema.enums.keys()
+
+def test_streaming_xlsx_rows():
+    import pickle
+    from xlschema.readers.xlsx.sheets import SheetRows
+    full = get_app('django.xlsx')
+    streamed = get_app('django.xlsx', streaming=True, no_cache=True,
+                       output='tests/data/output')
+    for m1, m2 in zip(full.schema.models, streamed.schema.models):
+        if m1.data:
+            assert isinstance(m2.data, SheetRows)
+            assert list(m2.data) == list(m1.data)
+            assert list(pickle.loads(pickle.dumps(m2.data))) == list(m1.data)
+
+def test_streaming_xlsx_closes_on_error(monkeypatch):
+    import openpyxl
+    from xlschema.common.exceptions import SchemaParsingError
+    from xlschema.readers.xlsx import xl_to_model
+    workbooks = []
+    _load_workbook = openpyxl.load_workbook
+
+    def load_workbook(*args, **kwds):
+        workbooks.append(_load_workbook(*args, **kwds))
+        return workbooks[-1]
+
+    monkeypatch.setattr(xl_to_model.openpyxl, 'load_workbook', load_workbook)
+    with pytest.raises(SchemaParsingError):
+        get_app('test-error-unreadable-format.xlsx', streaming=True,
+                no_cache=True, output='tests/data/output')
+    assert workbooks and all(wb._archive.fp is None for wb in workbooks)
+
+def test_parallel_xlsx(monkeypatch):
+    monkeypatch.setattr('os.cpu_count', lambda: 4)
+    serial = get_app('test-mixed.xlsx')
+    parallel = get_app('test-mixed.xlsx', jobs=2, no_cache=True,
+                       output='tests/data/output')
+    assert parallel.reader.jobs == 2
+    assert parallel.reader.workbook.read_only
+    assert [m.name for m in parallel.schema.models] == \
+        [m.name for m in serial.schema.models]
+    for m1, m2 in zip(serial.schema.models, parallel.schema.models):
+        assert m1.fieldnames == m2.fieldnames
+        assert m1.data == m2.data
+        assert m1.metadata == m2.metadata
+    assert parallel.schema.types == serial.schema.types
+
+def test_parallel_xlsx_single_cpu(monkeypatch):
+    monkeypatch.setattr('os.cpu_count', lambda: 1)
+    app = get_app('test-mixed.xlsx', jobs=4, no_cache=True,
+                  output='tests/data/output')
+    assert app.reader.jobs == 1
+    assert not app.reader.workbook.read_only
+
+def test_schema_only_xlsx():
+    app = get_app('schema.xlsx', schema_only=True, output='tests/data/output')
+    assert all(not model.data for model in app.schema.models)
+    assert all(model.fields for model in app.schema.models)
+
+def test_schema_cache_xlsx(tmp_path, monkeypatch):
+    from xlschema.config import Config
+    from xlschema.readers import CacheToModel, ExcelToModel
+    monkeypatch.setattr(Config, 'CACHE_DIR', tmp_path)
+    parsed = get_app('schema.xlsx')
+    cached = get_app('schema.xlsx', output='tests/data/output')
+    assert isinstance(parsed.reader, ExcelToModel)
+    assert isinstance(cached.reader, CacheToModel)
+    for m1, m2 in zip(parsed.schema.models, cached.schema.models):
+        assert m1.fieldnames == m2.fieldnames
+        assert m1.data == m2.data
+        assert m1.properties == m2.properties
+    assert parsed.schema.enums.keys() == cached.schema.enums.keys()
+    assert parsed.schema.types == cached.schema.types
+    schema_only = get_app('schema.xlsx', schema_only=True, output='tests/data/output')
+    assert isinstance(schema_only.reader, ExcelToModel)
+
+def test_schema_cache_unwritable(tmp_path, monkeypatch):
+    from xlschema.config import Config
+    from xlschema.readers import ExcelToModel
+    (tmp_path / 'cache').write_text('')
+    monkeypatch.setattr(Config, 'CACHE_DIR', tmp_path / 'cache')
+    app = get_app('schema.xlsx', output='tests/data/output')
+    assert isinstance(app.reader, ExcelToModel)
+    assert app.schema.models
+
+def test_schema_cache_keyed_on_path(tmp_path, monkeypatch):
+    import shutil
+    from xlschema.config import Config
+    from xlschema.readers import ExcelToModel
+    from xlschema.readers.xlsx.sheets import SheetRows
+    monkeypatch.setattr(Config, 'CACHE_DIR', tmp_path / 'cache')
+    get_app('schema.xlsx', streaming=True, output='tests/data/output')
+    copy = shutil.copy(xlsx('schema'), tmp_path / 'copy.xlsx')
+    app = get_app(str(copy), streaming=True, output='tests/data/output')
+    assert isinstance(app.reader, ExcelToModel)
+    assert app.schema.name == 'copy'
+    assert all(model.data.uri == str(copy) for model in app.schema.models
+               if isinstance(model.data, SheetRows))
+
+def test_schema_cache_xlsx_columnar(tmp_path, monkeypatch):
+    from xlschema.config import Config
+    from xlschema.readers import ExcelToModel
+    monkeypatch.setattr(Config, 'CACHE_DIR', tmp_path)
+    get_app('schema.xlsx', columnar=True, output='tests/data/output')
+    app = get_app('schema.xlsx', output='tests/data/output')
+    assert isinstance(app.reader, ExcelToModel)
+    assert all(isinstance(model.data, list)
+               for model in app.schema.models if model.data)
+
+def test_columnar_xlsx():
+    from xlschema.rows import ColumnStore
+    app = get_app('schema.xlsx')
+    columnar = get_app('schema.xlsx', columnar=True, output='tests/data/output')
+    for m1, m2 in zip(app.schema.models, columnar.schema.models):
+        assert isinstance(m2.data, ColumnStore)
+        assert m2.data == m1.data
+    columnar.write('sql/sqlite')
+    check('schema_sqlite.sql')
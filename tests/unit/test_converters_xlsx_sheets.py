@@ -40,3 +40,15 @@ def test_sheet(sheet):
 #     from xlschema.readers.xlsx.sheets import NoDataSheet
 #     sheet = NoDataSheet(sheet)
 #     sheet.parse()
+
+def test_property_sheet_single_pass(mocker):
+    from xlschema.readers.xlsx.sheets import PropertySheet
+    wb = openpyxl.load_workbook(xlsx('django'), read_only=True)
+    sheet = PropertySheet(wb['person'])
+    spy = mocker.spy(sheet, 'iter_values')
+    sheet.parse()
+    wb.close()
+    assert spy.call_count == 1
+    assert list(sheet.model.properties) == ['app', 'model']
+    assert sheet.model.fieldnames[0] == 'id'
+    assert len(sheet.model.data) > 0
@@ -31,3 +31,32 @@ def test_reading_all_yaml():
         name = '{}_sqlite.sql'.format(f.stem)
         assert exists(name)
     cleanup()
+
+def test_sidecar_yaml_data(tmp_path):
+    from xlschema.rows import StreamingRows
+    spec = yaml.safe_load(Path(YL_DIR, 'node.yml').read_text())
+    rows = spec['models'][0]['data']
+    fieldnames = [field['name'] for field in spec['models'][0]['fields']]
+    spec['models'][0]['data'] = 'node.data.yml'
+    (tmp_path / 'node.yml').write_text(yaml.safe_dump(spec))
+    (tmp_path / 'node.data.yml').write_text(
+        yaml.safe_dump(rows[:2]) + '---\n' +
+        yaml.safe_dump([dict(zip(fieldnames, row)) for row in rows[2:]]))
+    full = get_app('node.yml')
+    app = get_app(str(tmp_path / 'node.yml'), output='tests/data/output')
+    assert not app.reader.cacheable
+    assert app.schema.models[0].data == full.schema.models[0].data
+    streamed = get_app(str(tmp_path / 'node.yml'), streaming=True,
+                       output='tests/data/output')
+    data = streamed.schema.models[0].data
+    assert isinstance(data, StreamingRows)
+    assert list(data) == list(full.schema.models[0].data)
+
+def test_inline_yaml_data_validated_on_parse(tmp_path):
+    spec = yaml.safe_load(Path(YL_DIR, 'node_long_data.yml').read_text())
+    model = next(m for m in spec['models']
+                 if m.get('data') and isinstance(m['data'][0], dict))
+    del model['data'][0][model['fields'][0]['name']]
+    (tmp_path / 'node.yml').write_text(yaml.safe_dump(spec))
+    with pytest.raises(KeyError):
+        get_app(str(tmp_path / 'node.yml'), output='tests/data/output')
@@ -56,3 +56,26 @@ def test_pgenum_field_error_notype():
     with pytest.raises(fields.abstract.FieldError):
         f = fields.PgEnumField(*FIELD_CASES['error-notype'])
         type = f.type
+
+def test_fields_are_slotted():
+    import pickle
+    from xlschema.models import Model
+    for field_class in [fields.Field, fields.PostgresField, fields.DjangoField]:
+        field = field_class.from_dict(dict(name='id', type='int', index='pk'))
+        assert not hasattr(field, '__dict__')
+    model = Model('node', [field])
+    assert not hasattr(model, '__dict__')
+    clone = pickle.loads(pickle.dumps(model))
+    assert clone.fieldnames == ['id']
+    assert clone.fields[0].model is clone
+
+def test_field_specialize_shares_core():
+    field = fields.Field.from_dict(dict(name='id', type='int', index='pk'))
+    pg_field = field.specialize(fields.PostgresField)
+    dj_field = field.specialize(fields.DjangoField)
+    assert isinstance(pg_field, fields.PostgresField)
+    assert pg_field._core is dj_field._core
+    assert pg_field.values() == fields.PostgresField(*field.values()).values()
+    pg_field.index = None
+    assert pg_field.index is None
+    assert dj_field.index == field.index == 'pk'
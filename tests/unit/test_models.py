@@ -136,3 +136,68 @@ def test_namespace():
 
     # get the dict
     assert nspace.to_dict
+
+def test_model_rows_clean():
+    from datetime import datetime
+    from xlschema.fields import Field
+    from xlschema.models import Model
+    from xlschema.rows import ColumnStore
+    model = Model('event', [
+        Field.from_dict(dict(name='id', type='int')),
+        Field.from_dict(dict(name='day', type='date')),
+        Field.from_dict(dict(name='done', type='bool')),
+    ])
+    rows = [(1, datetime(2020, 1, 2), 1), (2, datetime(2020, 1, 3, 4), 0)]
+    expected = [[1, '2020-01-02', True], [2, '2020-01-03 04:00:00', False]]
+    assert [model.row_clean(row) for row in rows] == expected
+    assert model.rows_clean(rows) == expected
+    assert model.rows_clean(ColumnStore.from_model(model, rows)) == expected
+    rows.append((None, datetime(2020, 1, 4), None))
+    assert model.rows_clean(ColumnStore.from_model(model, rows)) == \
+        model.rows_clean(rows)
+    model.fields.append(Field.from_dict(dict(name='note', type='str')))
+    assert model.row_clean((1, None, 0, 'x')) == [1, 'None', False, 'x']
+
+def test_model_field_index():
+    from xlschema.fields import Field
+    from xlschema.models import Model
+    model = Model('node', [
+        Field.from_dict(dict(name='id', type='int', index='pk')),
+        Field.from_dict(dict(name='a', type='str', category='x')),
+        Field.from_dict(dict(name='b', type='str', category='y')),
+        Field.from_dict(dict(name='c', type='str', category='x')),
+    ])
+    assert model.has_pk and not model.has_fk
+    assert model.pk_field.name == 'id'
+    assert model.categories == ['x', 'y']
+    assert [f.name for f in model.category_fields] == ['a', 'b', 'c']
+    assert model.fieldnames_for_category('x') == ['a', 'c']
+    model.fields.append(Field.from_dict(dict(name='parent_id', type='int', index='fk')))
+    assert model.has_fk
+    model.fields[0].index = None
+    assert not model.has_pk and model.pk_field is None
+    model.fields[1] = Field.from_dict(dict(name='d', type='str', category='z'))
+    assert model.categories == ['z', 'y', 'x']
+
+def test_model_field_index_cost():
+    import time
+    from xlschema.fields import Field
+    from xlschema.models import Model
+    model = Model('wide', [Field.from_dict(dict(name='f{}'.format(i), type='int'))
+                           for i in range(8000)])
+    start = time.perf_counter()
+    assert not any(model.has_pk for _ in model.fields)
+    # per-access cost must not grow with the number of fields
+    assert time.perf_counter() - start < 1
+    model.fields.insert(0, Field.from_dict(dict(name='id', type='int', index='pk')))
+    assert model.has_pk
+
+def test_model_field_index_untyped_field():
+    from xlschema.fields import Field, FieldError
+    from xlschema.models import Model
+    model = Model('m', [Field.from_dict(dict(name='id', type='int', index='pk')),
+                        Field.from_dict(dict(name='x'))])
+    assert model.has_pk and model.pk_field.name == 'id'
+    assert model.enum_fields == []
+    with pytest.raises(FieldError):
+        model.mapped_fields
@@ -22,3 +22,8 @@ def test_plugin_app():
     app = Application()
     app.cmdline(['echo', 'world'])
     assert app.plugins
+
+def test_plugin_templates_compile(tmp_path):
+    app = Application()
+    app.cmdline(['templates', 'compile', '--cache-dir', str(tmp_path)])
+    assert list(tmp_path.rglob('*.py'))
@@ -0,0 +1,96 @@
+import pickle
+
+import pytest
+
+from xlschema.rows import ColumnStore, LazyRows, StreamingRows
+
+
+def test_lazy_rows_load_once():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [(1, 'a'), (2, 'b')]
+
+    rows = LazyRows(loader)
+    assert not rows.is_loaded
+    assert not calls
+    assert rows
+    assert len(rows) == 2
+    assert rows[1] == (2, 'b')
+    assert list(rows) == [(1, 'a'), (2, 'b')]
+    assert len(calls) == 1
+
+def test_lazy_rows_pickle():
+    rows = LazyRows(lambda: iter([(1,), (2,)]))
+    assert pickle.loads(pickle.dumps(rows)) == [(1,), (2,)]
+
+def test_streaming_rows_not_cached():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        yield from [(1, 'a'), (2, 'b')]
+
+    rows = StreamingRows(loader)
+    assert list(rows) == list(rows) == [(1, 'a'), (2, 'b')]
+    assert len(calls) == 2
+    assert rows and not rows.is_loaded
+    assert rows[1] == (2, 'b')
+    with pytest.raises(TypeError):
+        rows.append((3, 'c'))
+
+def test_streaming_rows_probed_once():
+    calls, probes = [], []
+
+    def loader():
+        calls.append(1)
+        yield from [(1, 'a')]
+
+    rows = StreamingRows(loader, probe=lambda: probes.append(1) or False)
+    assert not rows and not rows
+    assert not calls
+    assert len(probes) == 1
+    rows = StreamingRows(loader)
+    assert rows and rows.exists()
+    assert len(calls) == 1
+
+
+def test_column_store_typed_columns():
+    rows = [(1, 'a', 1.5, True), (2, 'b', 2.5, False)]
+    store = ColumnStore(['int', 'str', 'float', 'bool'], rows)
+    assert len(store) == 2
+    assert store == rows
+    assert store[-1] == (2, 'b', 2.5, False)
+    assert store[::-1] == rows[::-1]
+    assert store.column(0).typecode == 'q'
+    assert store.column(2).typecode == 'd'
+    assert isinstance(store.column(1), list)
+    assert pickle.loads(pickle.dumps(store)) == rows
+
+def test_column_store_nulls_and_ints():
+    rows = [(1, 1.5, True), (None, 2, False), (3, None, None)]
+    store = ColumnStore(['int', 'float', 'bool'], rows)
+    assert list(store) == rows
+    assert [store[i] for i in range(3)] == rows
+    assert type(store[1][1]) is int
+    assert [column.typecode for column in store.columns] == ['q', 'd', 'b']
+    assert pickle.loads(pickle.dumps(store)) == rows
+    assert list(store.values(1)) == [1.5, 2, None]
+
+def test_column_store_fallback():
+    store = ColumnStore(['int', 'float', 'bool'], [(1, 1.5, True)])
+    store.append((None, 2, False))
+    store.append((2 ** 70, 'x', 1))
+    assert list(store) == [(1, 1.5, True), (None, 2, False), (2 ** 70, 'x', 1)]
+    assert all(isinstance(column, list) for column in store.columns)
+
+def test_column_store_ragged_rows():
+    store = ColumnStore(['int', 'str'], [(1,), (2, 'b', 'extra')])
+    assert list(store) == [(1, None), (2, 'b')]
+
+def test_lazy_rows_factory():
+    rows = LazyRows(lambda: [(1,), (2,)], factory=lambda it: ColumnStore(['int'], it))
+    assert isinstance(rows.load(), ColumnStore)
+    rows.append((3,))
+    assert rows == [(1,), (2,), (3,)]
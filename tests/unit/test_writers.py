@@ -3,7 +3,7 @@ import os
 import pytest
 
 from conftest import (
-    OUTPUT, METHODS,
+    OUTPUT, METHODS, OPTIONS_DEFAULT,
     exists, check, get_app,
     cleanup, clean_local_dir)
 
@@ -23,6 +23,78 @@ def test_writer_class(app):
     writer.run()
     check('schema_sqlite.sql')
 
+def test_writer_render_to(app, tmp_path):
+    writer = app.get_writer('sql/postgres')
+    path = tmp_path / 'out.sql'
+    writer.write(to_path=str(path))
+    assert path.read_text() == writer.render()
+
+def test_writer_render_to_failure_truncates(app, tmp_path, monkeypatch):
+    writer = app.get_writer('sql/postgres')
+    monkeypatch.setattr(writer, 'template', 'sql/missing.sql')
+    path = tmp_path / 'out.sql'
+    with pytest.raises(Exception):
+        writer.write(to_path=str(path))
+    assert path.read_text() == ''
+
+def test_writer_validate_context(app):
+    writer = app.get_writer('sql/postgres')
+    context = {'rows': [[1, 'a'], [2, object()]], 'obj': object(), '_x': 1}
+    assert list(writer._validate_template_context(context)) == ['rows']
+    assert writer._validate_template_context(context, deep=True) == {}
+
+def test_writer_sqlite_batched(tmp_path):
+    import sqlite3
+
+    def load(**kwds):
+        app = get_app('node.yml', options=OPTIONS_DEFAULT, **kwds)
+        path = tmp_path / 'node_{}.sql'.format(kwds.get('batch_size', 0))
+        app.get_writer('sql/sqlite').write(to_path=str(path))
+        conn = sqlite3.connect(':memory:')
+        conn.executescript(path.read_text())
+        return path.read_text(), conn.execute(
+            'select * from node order by id').fetchall()
+
+    script, rows = load()
+    batched_script, batched_rows = load(batch_size=2)
+    assert rows and batched_rows == rows
+    assert 'begin;' in batched_script and 'commit;' in batched_script
+    assert batched_script.count('insert into') < script.count('insert into')
+
+def test_writer_sqlite_populate(tmp_path):
+    import sqlite3
+    app = get_app('node.yml', options=OPTIONS_DEFAULT, output=str(tmp_path))
+    writer = app.get_writer('sql/sqlite')
+    writer.populate()
+    writer.populate()  # tables are recreated
+    conn = sqlite3.connect(writer.db_path)
+    model = writer.schema.models[0]
+    count = conn.execute(
+        'select count(*) from {}'.format(model.name)).fetchone()[0]
+    assert count == len(list(model.data)) > 0
+
+def test_writer_sqlite_populate_failure_rolls_back(tmp_path, monkeypatch):
+    import sqlite3
+    app = get_app('node.yml', options=OPTIONS_DEFAULT, output=str(tmp_path))
+    writer = app.get_writer('sql/sqlite')
+    writer.populate()
+    model = writer.schema.models[0]
+    count = len(list(model.data))
+    # a tiny page cache makes the failing load spill pages to the file
+    monkeypatch.setattr(writer, 'LOAD_PRAGMAS',
+                        dict(writer.LOAD_PRAGMAS, cache_size=10))
+    # a duplicate primary key makes the load fail after many inserts
+    model.data.extend([[100 + i, None, 'x' * 100, 'open'] for i in range(20000)])
+    model.data.append(list(model.data[0]))
+    with pytest.raises(sqlite3.IntegrityError):
+        writer.populate()
+    with pytest.raises(sqlite3.IntegrityError):
+        app.populate('sql/sqlite')
+    conn = sqlite3.connect(writer.db_path)
+    assert conn.execute('pragma integrity_check').fetchone() == ('ok',)
+    assert conn.execute(
+        'select count(*) from {}'.format(model.name)).fetchone()[0] == count
+
 def test_excel_writer():
     app = get_app('test-no-data.xlsx')
     app.write('xlsx/validation')
@@ -199,3 +271,15 @@ def test_xlschema_yml_yaml(app):
     writer = app.get_writer('yml/yaml')
     writer.run()
     check('schema_yaml.yml')
+
+def test_multi_writer_renders_to_files(tmp_path, monkeypatch):
+    writer = get_app('schema.yml', output=str(tmp_path)).get_writer('hs/model')
+    model = writer.schema.models[0]
+    expected = writer.render(model=model, is_model_template=True)
+    # models are rendered straight into their files, not into strings
+    monkeypatch.setattr(writer, 'render', None)
+    writer.write()
+    paths = sorted(p.name for p in tmp_path.iterdir())
+    assert paths == sorted('{}.hs'.format(model.name.classname)
+                           for model in writer.schema.models)
+    assert (tmp_path / '{}.hs'.format(model.name.classname)).read_text() == expected